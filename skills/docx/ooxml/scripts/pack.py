@@ -3,17 +3,47 @@
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--original <office_file>]
+                   [--jobs N]
 """
 
 import argparse
+import io
 import shutil
-import subprocess
+import struct
 import sys
 import tempfile
-import defusedxml.minidom
 import zipfile
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+
+try:
+    from . import soffice_pool
+    from .validation.cache import hash_file
+    from .validation.formatting import condense_xml_bytes, format_contents
+    from .validation.manifest import MANIFEST_NAME, PartManifest
+    from .validation.parts import open_archive
+except ImportError:  # Run as a script from this directory
+    import soffice_pool
+    from validation.cache import hash_file
+    from validation.formatting import condense_xml_bytes, format_contents
+    from validation.manifest import MANIFEST_NAME, PartManifest
+    from validation.parts import open_archive
+
+# Size of the fixed part of a zip local file header
+LOCAL_HEADER_SIZE = 30
+LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+# ZipFile attributes that raw copies read and update. They are not public API,
+# so raw copies are only made by CPython, whose zipfile keeps the central
+# directory in them, and fall back to recompressing elsewhere.
+RAW_COPY_ATTRIBUTES = (
+    "fp",
+    "filelist",
+    "NameToInfo",
+    "start_dir",
+    "_didModify",
+    "_writing",
+)
 
 
 def main():
@@ -21,11 +51,33 @@ def main():
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--original",
+        help="Office file the directory was unpacked from; members unchanged "
+        "since unpacking are copied from it without recompressing",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes for condensing large packages (default: all CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Validate with soffice even if an identical file was validated before",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            original_file=args.original,
+            jobs=args.jobs,
+            use_cache=not args.no_cache,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +94,29 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(
+    input_dir,
+    output_file,
+    validate=False,
+    original_file=None,
+    jobs=None,
+    use_cache=True,
+):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        original_file: Office file the directory was unpacked from (optional).
+            Members whose hash still matches the unpack manifest are copied from
+            it as raw compressed entries; all others are packed as usual. Parts
+            left in the original by a lazy unpack are always copied from it,
+            from the file recorded in the manifest if no original is given.
+        jobs: Worker processes for condensing XML parts of large packages
+            (default: one per CPU)
+        use_cache: If False, validation does not reuse the soffice conversion
+            of an identical file (default: True)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,34 +129,302 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+    manifest = PartManifest.load(input_dir)
+    # Parts a lazy unpack left in the original and that were never materialised
+    lazy_parts = []
+    if manifest is not None:
+        lazy_parts = [
+            name for name in manifest.lazy_parts() if not (input_dir / name).exists()
+        ]
+    original_zip = _open_reference(
+        input_dir, output_file, original_file, manifest, lazy_parts
+    )
 
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
+    # Stream members straight into the archive; the input directory is only read
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        members = []  # (path, arcname, how the member is written)
+        for f in input_dir.rglob("*"):
+            # The part-hash manifest written by unpack.py is not a package part
+            if not f.is_file() or f.name == MANIFEST_NAME:
+                continue
+
+            arcname = f.relative_to(input_dir)
+            if original_zip is not None and _is_unchanged(
+                original_zip, manifest, f, arcname.as_posix()
+            ):
+                members.append((f, arcname, "raw"))
+            elif f.name.endswith((".xml", ".rels")) and (
+                manifest is None or manifest.was_formatted(arcname.as_posix())
+            ):
+                members.append((f, arcname, "condense"))
+            else:
+                members.append((f, arcname, "copy"))
+        for name in lazy_parts:
+            members.append((None, PurePosixPath(name), "raw"))
+
+        # Remove pretty-printing whitespace in memory, in parallel for large packages
+        condensed = iter(
+            format_contents(
+                (f.read_bytes() for f, _, how in members if how == "condense"),
+                condense_xml_bytes,
+                jobs,
+            )
+        )
 
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
         with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
+            for f, arcname, how in members:
+                if how == "raw":
+                    # Untouched since unpacking or never extracted: reuse the
+                    # original compressed bytes
+                    _copy_raw_member(original_zip, arcname.as_posix(), zf)
+                elif how == "condense":
+                    zinfo = zipfile.ZipInfo.from_file(f, arcname)
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    zf.writestr(zinfo, next(condensed))
+                else:
+                    # Media, other binary parts and XML parts extracted verbatim
+                    # are copied through unchanged
+                    zf.write(f, arcname)
+    finally:
+        if original_zip is not None:
+            original_zip.close()
 
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file, use_cache):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
-def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+def pack_bytes(parts, jobs=None):
+    """Pack an in-memory package into an Office file held in memory.
+
+    The in-memory counterpart of pack_document; nothing is written to disk and
+    the result is not validated.
+
+    Args:
+        parts: PackageParts, e.g. as returned by unpack.unpack_bytes(). Parts
+            unchanged since unpacking are copied from its source as raw
+            compressed entries; pretty-printed and new XML parts are condensed.
+        jobs: Worker processes for condensing XML parts of large packages
+            (default: one per CPU)
+
+    Returns:
+        bytes: The packed Office file
+    """
+    source_zip = open_archive(parts.source) if parts.source is not None else None
+    try:
+        members = []  # (name, how the member is written)
+        for name in parts:
+            if source_zip is not None and _is_unchanged_in_memory(
+                source_zip, parts, name
+            ):
+                members.append((name, "raw"))
+            elif name.endswith((".xml", ".rels")) and parts.was_formatted(name):
+                members.append((name, "condense"))
+            else:
+                members.append((name, "copy"))
+
+        condensed = iter(
+            format_contents(
+                (parts[name] for name, how in members if how == "condense"),
+                condense_xml_bytes,
+                jobs,
+            )
+        )
+
+        output = io.BytesIO()
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, how in members:
+                if how == "raw":
+                    _copy_raw_member(source_zip, name, zf)
+                elif how == "condense":
+                    zf.writestr(name, next(condensed))
+                else:
+                    zf.writestr(name, parts[name])
+    finally:
+        if source_zip is not None:
+            source_zip.close()
+
+    return output.getvalue()
+
+
+def _is_unchanged_in_memory(source_zip, parts, name):
+    """Return True if an in-memory part still has the contents it was unpacked
+    with and its source archive holds it as a plain (unencrypted) member."""
+    return parts.is_unchanged(name) and _is_plain_member(source_zip, name)
+
+
+def _open_reference(input_dir, output_file, original_file, manifest, lazy_parts):
+    """Open the original archive for raw member reuse.
+
+    Without an explicit original, the source recorded in the manifest is opened
+    if a lazy unpack left parts in it.
+
+    Returns:
+        ZipFile or None: None if there is no original or the directory's
+            manifest does not describe it
+
+    Raises:
+        ValueError: If lazily unpacked parts cannot be read from the original
+    """
+    if original_file is None:
+        if not lazy_parts:
+            return None
+        if Path(manifest.source_path).resolve() == output_file.resolve():
+            raise ValueError(f"{output_file} must differ from the original file")
+        try:
+            return manifest.open_source()
+        except ValueError as e:
+            raise ValueError(
+                f"{len(lazy_parts)} parts of {input_dir} are still in the file it "
+                f"was lazily unpacked from: {e}"
+            )
+
+    original_file = Path(original_file)
+    if original_file.resolve() == output_file.resolve():
+        raise ValueError(f"{output_file} must differ from the original file")
+
+    if manifest is None:
+        print(
+            f"Warning: {input_dir} has no unpack manifest; repacking all members",
+            file=sys.stderr,
+        )
+        return None
+    if manifest.source_sha256 != hash_file(original_file):
+        if lazy_parts:
+            raise ValueError(
+                f"{input_dir} was not unpacked from {original_file}, which holds "
+                f"{len(lazy_parts)} of its parts"
+            )
+        print(
+            f"Warning: {input_dir} was not unpacked from {original_file}; "
+            "repacking all members",
+            file=sys.stderr,
+        )
+        return None
+
+    return zipfile.ZipFile(original_file)
+
+
+def _is_unchanged(original_zip, manifest, file_path, name):
+    """Return True if a file still has the bytes it was unpacked with and the
+    original archive holds it as a plain (unencrypted) member."""
+    unpacked_sha256 = manifest.unpacked_sha256(name)
+    if unpacked_sha256 is None or unpacked_sha256 != hash_file(file_path):
+        return False
+    return _is_plain_member(original_zip, name)
+
+
+def _is_plain_member(archive, name):
+    """Return True if an archive holds a member without encryption."""
+    try:
+        info = archive.getinfo(name)
+    except KeyError:
+        return False
+    return not info.flag_bits & 0x1
+
+
+def _copy_raw_member(source, name, target):
+    """Copy a member between archives without decompressing it.
+
+    zipfile has no public API for raw copies, so the compressed bytes are read
+    from behind the member's local header in the source archive and written
+    behind a fresh local header in the target, which is then registered in the
+    target's central directory.
+
+    The fresh header takes the CRC and sizes from the source's central
+    directory, so members written with a data descriptor (whose local header
+    has no sizes) are copied without it. Members that need ZIP64 sizes or
+    offsets, and targets whose zipfile internals are not the expected ones,
+    are decompressed and recompressed instead.
+
+    Args:
+        source: ZipFile opened for reading
+        name: Member name
+        target: ZipFile opened for writing
+    """
+    info = source.getinfo(name)
+    if not _can_copy_raw(source, info, target):
+        _recompress_member(source, info, target)
+        return
+
+    zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+    zinfo.external_attr = info.external_attr
+    zinfo.create_system = info.create_system
+    # Sizes go in the local header, so no trailing data descriptor is needed
+    zinfo.flag_bits = info.flag_bits & ~0x08
+
+    # Locate the compressed data after the source's local header
+    source.fp.seek(info.header_offset)
+    header = source.fp.read(LOCAL_HEADER_SIZE)
+    if len(header) != LOCAL_HEADER_SIZE or header[:4] != LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(
+            f"Bad local header for member {name} in original file"
+        )
+    (method,) = struct.unpack("<H", header[8:10])
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    if method != info.compress_type:
+        raise zipfile.BadZipFile(
+            f"Inconsistent compression of member {name} in original file"
+        )
+    source.fp.seek(name_length + extra_length, 1)
+
+    zinfo.header_offset = target.fp.tell()
+    target.fp.write(zinfo.FileHeader(zip64=False))
+    remaining = info.compress_size
+    while remaining:
+        chunk = source.fp.read(min(remaining, 1024 * 1024))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated member {name} in original file")
+        target.fp.write(chunk)
+        remaining -= len(chunk)
+
+    target.filelist.append(zinfo)
+    target.NameToInfo[zinfo.filename] = zinfo
+    target.start_dir = target.fp.tell()
+    target._didModify = True
+
+
+def _can_copy_raw(source, info, target):
+    """Return True if _copy_raw_member can copy a member without recompressing it."""
+    if sys.implementation.name != "cpython":
+        return False
+    if not all(hasattr(target, attribute) for attribute in RAW_COPY_ATTRIBUTES):
+        return False
+    if source.fp is None or target.fp is None or target._writing:
+        return False
+    # Sizes and offsets that need ZIP64 extra fields are left to zipfile
+    header_size = LOCAL_HEADER_SIZE + len(info.filename.encode())
+    end = target.fp.tell() + header_size + info.compress_size
+    return max(info.file_size, info.compress_size, end) < zipfile.ZIP64_LIMIT
+
+
+def _recompress_member(source, info, target):
+    """Copy a member between archives by decompressing and recompressing it."""
+    zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.external_attr = info.external_attr
+    zinfo.create_system = info.create_system
+    # zipfile decides from the expected size whether the member needs ZIP64
+    zinfo.file_size = info.file_size
+    with source.open(info) as src, target.open(zinfo, "w") as dst:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def validate_document(doc_path, use_cache=True):
+    """Validate document by converting to HTML with soffice.
+
+    The conversion runs on the soffice worker pool when it is available, and is
+    skipped if the same file was converted before (unless use_cache is False).
+    """
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -100,29 +436,14 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
-            result = subprocess.run(
-                [
-                    "soffice",
-                    "--headless",
-                    "--convert-to",
-                    filter_name,
-                    "--outdir",
-                    temp_dir,
-                    str(doc_path),
-                ],
-                capture_output=True,
-                timeout=10,
-                text=True,
+            soffice_pool.convert(
+                doc_path, temp_dir, filter_name, timeout=10, use_cache=use_cache
             )
-            if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
-                error_msg = result.stderr.strip() or "Document validation failed"
-                print(f"Validation error: {error_msg}", file=sys.stderr)
-                return False
             return True
         except FileNotFoundError:
             print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
             return True
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             print("Validation error: Timeout during conversion", file=sys.stderr)
             return False
         except Exception as e:
@@ -131,28 +452,9 @@ def validate_document(doc_path):
 
 
 def condense_xml(xml_file):
-    """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
-
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
-
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    """Strip unnecessary whitespace and remove comments from an XML file in place."""
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(condense_xml_bytes(xml_file.read_bytes()))
 
 
 if __name__ == "__main__":
@@ -3,12 +3,12 @@ Validator for Word document XML files against XSD schemas.
 """
 
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .package import OOXMLPackage
+from .paragraphs import scan_paragraphs
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -21,53 +21,62 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     # Start with empty mapping - add specific cases as we discover them
     ELEMENT_RELATIONSHIP_TYPES = {}
 
-    def validate(self):
-        """Run all validation checks and return True if all pass."""
+    def validate(self, tier="full", budget=None):
+        """Run all validation checks and return True if all pass.
+
+        Args:
+            tier: "full" runs every check; "fast" runs only the cheap structural
+                checks (FAST_CHECKS) and stops at the first failure
+            budget: Wall-clock budget in seconds for the whole run (default: none)
+        """
+        self._start_checks(tier, budget)
+
         # Test 0: XML well-formedness
-        if not self.validate_xml():
-            return False
+        if not self._run_check(self.validate_xml):
+            return self._finish_checks(False)
 
         # Test 1: Namespace declarations
         all_valid = True
-        if not self.validate_namespaces():
+        if not self._run_check(self.validate_namespaces):
             all_valid = False
 
         # Test 2: Unique IDs
-        if not self.validate_unique_ids():
+        if not self._run_check(self.validate_unique_ids):
             all_valid = False
 
         # Test 3: Relationship and file reference validation
-        if not self.validate_file_references():
+        if not self._run_check(self.validate_file_references):
             all_valid = False
 
         # Test 4: Content type declarations
-        if not self.validate_content_types():
+        if not self._run_check(self.validate_content_types):
             all_valid = False
 
         # Test 5: XSD schema validation
-        if not self.validate_against_xsd():
+        if not self._run_check(self.validate_against_xsd):
             all_valid = False
 
         # Test 6: Whitespace preservation
-        if not self.validate_whitespace_preservation():
+        if not self._run_check(self.validate_whitespace_preservation):
             all_valid = False
 
         # Test 7: Deletion validation
-        if not self.validate_deletions():
+        if not self._run_check(self.validate_deletions):
             all_valid = False
 
         # Test 8: Insertion validation
-        if not self.validate_insertions():
+        if not self._run_check(self.validate_insertions):
             all_valid = False
 
         # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
+        if not self._run_check(self.validate_all_relationship_ids):
             all_valid = False
 
-        # Count and compare paragraphs
-        self.compare_paragraph_counts()
+        # Count and compare paragraphs (informational, full tier only)
+        if tier == "full" and not self.budget_exhausted:
+            self.compare_paragraph_counts()
 
-        return all_valid
+        return self._finish_checks(all_valid)
 
     def validate_whitespace_preservation(self):
         """
@@ -79,9 +88,10 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
+            self._examine(xml_file)
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.package.getroot(xml_file)
 
                 # Find all w:t elements
                 for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
@@ -113,8 +123,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
-            for error in errors:
-                print(error)
+            self._print_errors(errors)
             return False
         else:
             if self.verbose:
@@ -132,9 +141,10 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             # Only check document.xml files
             if xml_file.name != "document.xml":
                 continue
+            self._examine(xml_file)
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.package.getroot(xml_file)
 
                 # Find all w:t elements that are descendants of w:del elements
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
@@ -162,8 +172,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
-            for error in errors:
-                print(error)
+            self._print_errors(errors)
             return False
         else:
             if self.verbose:
@@ -180,7 +189,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.package.getroot(xml_file)
                 # Count all w:p elements
                 paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
                 count = len(paragraphs)
@@ -194,19 +203,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Stream document.xml straight from the original archive
+            with OOXMLPackage(self.original_file) as original_package:
+                with original_package.open(
+                    original_package.root_dir / "word" / "document.xml"
+                ) as f:
+                    # Count all w:p elements
+                    count = scan_paragraphs(f).paragraph_count
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -223,9 +226,10 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         for xml_file in self.xml_files:
             if xml_file.name != "document.xml":
                 continue
+            self._examine(xml_file)
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self.package.getroot(xml_file)
                 namespaces = {"w": self.WORD_2006_NAMESPACE}
 
                 # Find w:delText in w:ins that are NOT within w:del
@@ -252,8 +256,7 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         if errors:
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
-            for error in errors:
-                print(error)
+            self._print_errors(errors)
             return False
         else:
             if self.verbose:
@@ -0,0 +1,163 @@
+"""
+Relationship and content-type graph of an Office package.
+"""
+
+from collections import namedtuple
+from pathlib import PurePosixPath
+
+Relationship = namedtuple(
+    "Relationship",
+    ["rels_file", "source", "rid", "type", "target", "target_path", "line"],
+)
+Relationship.__doc__ = """A typed edge of the package graph.
+
+Attributes:
+    rels_file: .rels part that declares the relationship
+    source: Part the relationship belongs to (None for the package root)
+    rid: Relationship ID (Id attribute)
+    type: Relationship type URI (Type attribute, "" if missing)
+    target: Target as written in the .rels part
+    target_path: Resolved path of an internal target, None for external or
+        unresolvable targets
+    line: Line of the Relationship element in the .rels part
+"""
+
+
+class PackageGraph:
+    """Parts of a package linked by their relationships and content types.
+
+    Built once per package from the shared parsed trees: every .rels part
+    contributes typed edges from its source part to their targets, and
+    [Content_Types].xml contributes the override and default declarations.
+    Checks query the graph instead of rescanning the package.
+
+    A .rels part that cannot be parsed has no edges; relationships() re-raises
+    its parse error so each check can report it.
+
+    Attributes:
+        rels_files: All .rels parts, in package order
+        parts: All files of the package except [Content_Types].xml and .rels parts
+    """
+
+    def __init__(self, package):
+        self.package = package
+        self.rels_files = [f for f in package.xml_files if f.name.endswith(".rels")]
+        self.parts = [
+            f
+            for f in package.all_files
+            if f.name != "[Content_Types].xml" and not f.name.endswith(".rels")
+        ]
+
+        self._relationships = {}  # rels file -> [Relationship] or parse exception
+        self._incoming = {}  # target path -> [Relationship]
+        for rels_file in self.rels_files:
+            try:
+                self._relationships[rels_file] = self._read_relationships(rels_file)
+            except Exception as e:
+                self._relationships[rels_file] = e
+                continue
+            for rel in self._relationships[rels_file]:
+                if rel.target_path is not None:
+                    self._incoming.setdefault(rel.target_path, []).append(rel)
+
+    def _read_relationships(self, rels_file):
+        """Build the edges declared in a .rels part."""
+        if rels_file.name == ".rels":
+            # Root .rels file - targets are relative to the package root
+            source = None
+            base_dir = self.package.root_dir
+        else:
+            # Other .rels files - targets are relative to their parent's parent
+            # e.g., word/_rels/document.xml.rels -> targets relative to word/
+            base_dir = rels_file.parent.parent
+            source = base_dir / rels_file.name[: -len(".rels")]
+
+        relationships = []
+        for rel in self.package.relationships(rels_file):
+            target = rel.get("Target")
+            target_path = None
+            if target and not target.startswith(("http", "mailto:")):
+                try:
+                    target_path = self.package.resolve(base_dir / target)
+                except (OSError, ValueError):
+                    pass
+            relationships.append(
+                Relationship(
+                    rels_file,
+                    source,
+                    rel.get("Id"),
+                    rel.get("Type", ""),
+                    target,
+                    target_path,
+                    rel.sourceline,
+                )
+            )
+        return relationships
+
+    def relationships(self, rels_file):
+        """Return the edges declared in a .rels part.
+
+        Raises:
+            Exception: The error raised while parsing the .rels part, if any
+        """
+        relationships = self._relationships.get(rels_file)
+        if relationships is None:
+            # Not a known .rels part (e.g. a path built for a part without rels)
+            return []
+        if isinstance(relationships, Exception):
+            raise relationships
+        return relationships
+
+    def outgoing(self, part):
+        """Return the edges whose source is a part (from its .rels part)."""
+        return self.relationships(self.package.rels_file_for(part))
+
+    def has_rels(self, part):
+        """Return True if a part has a .rels part."""
+        return self.package.rels_file_for(part) in self._relationships
+
+    def incoming(self, part):
+        """Return the internal edges that target a part."""
+        return self._incoming.get(part, [])
+
+    def rels_files_matching(self, pattern):
+        """Return the .rels parts whose package path matches a glob pattern."""
+        depth = len(PurePosixPath(pattern).parts)
+        matches = []
+        for rels_file in self.rels_files:
+            name = PurePosixPath(self.package.relative_path(rels_file).as_posix())
+            if len(name.parts) == depth and name.match(pattern):
+                matches.append(rels_file)
+        return matches
+
+    def is_dangling(self, rel):
+        """Return True if an internal edge points to a file that does not exist."""
+        if not rel.target or rel.target.startswith(("http", "mailto:")):
+            return False
+        return rel.target_path is None or not self.package.is_file(rel.target_path)
+
+    def orphans(self):
+        """Return the parts that no relationship targets, sorted by path."""
+        return sorted(part for part in self.parts if part not in self._incoming)
+
+    @property
+    def overrides(self):
+        """Map of part name (without the leading '/') to declared content type."""
+        return self.package.content_types()[0]
+
+    @property
+    def defaults(self):
+        """Map of lowercase extension to declared content type."""
+        return self.package.content_types()[1]
+
+    def has_override(self, part):
+        """Return True if [Content_Types].xml has an Override for a part."""
+        return self.package.relative_path(part).as_posix() in self.overrides
+
+    def has_default(self, extension):
+        """Return True if [Content_Types].xml has a Default for an extension."""
+        return extension.lower() in self.defaults
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
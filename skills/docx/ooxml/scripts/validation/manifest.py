@@ -0,0 +1,266 @@
+"""
+Part-hash manifest written by unpack.py and used for incremental validation.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+from .cache import hash_file
+
+# Manifest file stored at the root of an unpacked package. It is not a package
+# part: pack.py leaves it out of the archive and the validators ignore it.
+MANIFEST_NAME = ".ooxml-manifest.json"
+
+# Bump when the manifest layout changes; older manifests are then ignored
+MANIFEST_VERSION = 1
+
+
+def write_manifest(unpacked_dir, source_file, formatted_parts=None, lazy_parts=()):
+    """Record the content hash of every part in a freshly unpacked package.
+
+    Args:
+        unpacked_dir: Path to the unpacked package directory
+        source_file: Path to the Office file it was unpacked from
+        formatted_parts: Names of the parts that were pretty-printed (default:
+            every XML and .rels part on disk)
+        lazy_parts: Names of the parts left in the source file by a lazy unpack
+
+    Returns:
+        PartManifest: The manifest that was written
+    """
+    unpacked_dir = Path(unpacked_dir)
+    parts = {}
+    for file_path in unpacked_dir.rglob("*"):
+        if file_path.is_file() and file_path.name != MANIFEST_NAME:
+            part_name = file_path.relative_to(unpacked_dir).as_posix()
+            if formatted_parts is None:
+                formatted = part_name.endswith((".xml", ".rels"))
+            else:
+                formatted = part_name in formatted_parts
+            parts[part_name] = {
+                "sha256": hash_file(file_path),
+                "size": file_path.stat().st_size,
+                "formatted": formatted,
+            }
+
+    if lazy_parts:
+        # Not extracted, so the hash is only known once the part is materialised
+        with zipfile.ZipFile(source_file) as zf:
+            for part_name in lazy_parts:
+                parts[part_name] = {
+                    "sha256": None,
+                    "size": zf.getinfo(part_name).file_size,
+                    "formatted": False,
+                    "lazy": True,
+                }
+
+    data = {
+        "version": MANIFEST_VERSION,
+        "source": {
+            "name": Path(source_file).name,
+            "path": str(Path(source_file).resolve()),
+            "sha256": hash_file(source_file),
+        },
+        "parts": dict(sorted(parts.items())),
+        "checks": {},
+    }
+    manifest = PartManifest(unpacked_dir / MANIFEST_NAME, data)
+    manifest.save()
+    return manifest
+
+
+def materialize_parts(unpacked_dir, patterns=None):
+    """Extract the parts a lazy unpack left in the source file.
+
+    Parts that are already on disk are left alone.
+
+    Args:
+        unpacked_dir: Path to the unpacked package directory
+        patterns: Part names or glob patterns to materialise (default: all)
+
+    Returns:
+        list: Paths of the files that were extracted
+
+    Raises:
+        ValueError: If the source file is missing or has changed since unpacking
+    """
+    manifest = PartManifest.load(unpacked_dir)
+    if manifest is None:
+        return []
+
+    extracted = []
+    for part_name in manifest.lazy_parts():
+        if patterns is not None and not any(
+            fnmatch.fnmatchcase(part_name, pattern) for pattern in patterns
+        ):
+            continue
+        if not (manifest.root_dir / part_name).exists():
+            extracted.append(manifest.materialize(part_name))
+    if extracted:
+        manifest.save()
+    return extracted
+
+
+class PartManifest:
+    """Per-part content hashes of an unpacked package plus cached check results.
+
+    The "parts" table holds the hash of every part as it was written by unpack.py,
+    so a part whose current hash matches is unchanged since unpacking. It also
+    records whether unpack.py pretty-printed a part (pack.py only condenses those)
+    and which parts a lazy unpack left in the source file. The "checks" table
+    caches per-part validation results keyed by the hashes they were computed
+    from, so unchanged parts can skip their checks entirely.
+    """
+
+    def __init__(self, path, data):
+        self.path = Path(path)
+        self.root_dir = self.path.parent
+        self.data = data
+        self._dirty = False
+        self._source_checked = False
+
+    @classmethod
+    def load(cls, unpacked_dir):
+        """Load the manifest of an unpacked package.
+
+        Returns:
+            PartManifest or None: None if the package has no usable manifest
+        """
+        path = Path(unpacked_dir) / MANIFEST_NAME
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return None
+        data.setdefault("parts", {})
+        data.setdefault("checks", {})
+        return cls(path, data)
+
+    @property
+    def source_sha256(self):
+        """SHA-256 of the Office file the package was unpacked from."""
+        return self.data.get("source", {}).get("sha256")
+
+    @property
+    def source_path(self):
+        """Absolute path of the Office file the package was unpacked from."""
+        return self.data.get("source", {}).get("path")
+
+    def unpacked_sha256(self, part_name):
+        """Return the hash a part had when it was unpacked.
+
+        Returns:
+            str or None: None if the part is new or still in the source file
+        """
+        entry = self.data["parts"].get(part_name)
+        return entry["sha256"] if entry else None
+
+    def was_formatted(self, part_name):
+        """Return True if a part is expected in pretty-printed form.
+
+        Parts that unpack.py pretty-printed and parts added since unpacking are;
+        parts extracted verbatim by a partial or lazy unpack are not.
+        """
+        entry = self.data["parts"].get(part_name)
+        return entry is None or entry.get("formatted", True)
+
+    def lazy_parts(self):
+        """Return the names of the parts a lazy unpack left in the source file."""
+        return [
+            part_name
+            for part_name, entry in self.data["parts"].items()
+            if entry.get("lazy")
+        ]
+
+    def open_source(self):
+        """Open the Office file the package was unpacked from.
+
+        Returns:
+            zipfile.ZipFile: The source archive
+
+        Raises:
+            ValueError: If the source file is missing or has changed since unpacking
+        """
+        source_path = self.source_path
+        if not source_path or not Path(source_path).is_file():
+            raise ValueError(f"Source file {source_path or '(unknown)'} not found")
+        if not self._source_checked:
+            if hash_file(source_path) != self.source_sha256:
+                raise ValueError(f"Source file {source_path} changed since unpacking")
+            self._source_checked = True
+        return zipfile.ZipFile(source_path)
+
+    def materialize(self, part_name):
+        """Extract a part left in the source file by a lazy unpack, verbatim.
+
+        The part is recorded as unpacked with its hash; call save() to persist.
+
+        Returns:
+            Path: The extracted file
+
+        Raises:
+            ValueError: If the source file is missing or has changed since unpacking
+        """
+        with self.open_source() as zf:
+            content = zf.read(part_name)
+        file_path = self.root_dir / part_name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+
+        entry = self.data["parts"][part_name]
+        entry["sha256"] = hashlib.sha256(content).hexdigest()
+        entry["lazy"] = False
+        self._dirty = True
+        return file_path
+
+    def cached_result(self, check, part_name, key):
+        """Return the cached result of a check for a part, or None on a miss.
+
+        Args:
+            check: Name of the check
+            part_name: Posix path of the part relative to the package root
+            key: Hash key the result must have been computed from
+        """
+        entry = self.data["checks"].get(check, {}).get(part_name)
+        if entry is not None and entry["key"] == key:
+            return entry["result"]
+        return None
+
+    def store_result(self, check, part_name, key, result):
+        """Cache the JSON-serialisable result of a check for a part."""
+        self.data["checks"].setdefault(check, {})[part_name] = {
+            "key": key,
+            "result": result,
+        }
+        self._dirty = True
+
+    def save(self):
+        """Write the manifest atomically."""
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.data, f)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        self._dirty = False
+
+    def flush(self):
+        """Write cached check results if any changed. Failures are ignored."""
+        if self._dirty:
+            try:
+                self.save()
+            except OSError:
+                pass
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
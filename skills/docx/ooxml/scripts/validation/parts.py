@@ -0,0 +1,234 @@
+"""
+In-memory unpacked Office packages.
+"""
+
+import io
+import mmap
+import posixpath
+import zipfile
+from collections.abc import MutableMapping
+from pathlib import Path
+
+
+def is_in_memory(source):
+    """Return True if a package source is held in memory rather than on disk.
+
+    In-memory sources are PackageParts, bytes-like packed files (bytes,
+    bytearray, memoryview, mmap) and binary file objects such as io.BytesIO.
+    """
+    return isinstance(
+        source, (PackageParts, bytes, bytearray, memoryview, mmap.mmap)
+    ) or (hasattr(source, "read") and hasattr(source, "seek"))
+
+
+def open_archive(source):
+    """Open a packed Office file held in memory without copying it.
+
+    Args:
+        source: bytes-like object (bytes, bytearray, memoryview, mmap) or a
+            seekable binary file object
+
+    Returns:
+        zipfile.ZipFile: The archive, opened for reading
+    """
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        source = _BufferReader(source)
+    return zipfile.ZipFile(source)
+
+
+class _BufferReader(io.RawIOBase):
+    """Seekable read-only file over a buffer, reading it in place."""
+
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._position = max(offset, 0)
+        return self._position
+
+    def readinto(self, buffer):
+        chunk = self._view[self._position : self._position + len(buffer)]
+        buffer[: len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+
+class PackageParts(MutableMapping):
+    """An unpacked Office package held in memory.
+
+    Maps part names (e.g. "word/document.xml") to their contents, in archive
+    order. This is the in-memory counterpart of a directory written by
+    unpack.py: parts are created by unpack.unpack_bytes(), edited through
+    Document/XMLEditor via part paths (see root and path()), validated with the
+    validators and packed back with pack.pack_bytes(). Nothing is written to
+    disk.
+
+    Attributes:
+        name: Name of the package, used in messages (default: "package")
+        source: Packed file the parts were unpacked from (bytes-like or file
+            object), or None. Unchanged parts are copied from it when packing.
+        formatted: Names of the parts that were pretty-printed when unpacking
+    """
+
+    def __init__(self, parts=None, source=None, formatted=(), name="package"):
+        self._parts = dict(parts or {})
+        # Contents as unpacked, to recognise parts that are still unchanged
+        self._unpacked = dict(self._parts)
+        self.source = source
+        self.formatted = set(formatted)
+        self.name = name
+
+    def __getitem__(self, part_name):
+        return self._parts[part_name]
+
+    def __setitem__(self, part_name, content):
+        self._parts[part_name] = bytes(content)
+
+    def __delitem__(self, part_name):
+        del self._parts[part_name]
+
+    def __iter__(self):
+        return iter(self._parts)
+
+    def __len__(self):
+        return len(self._parts)
+
+    def __repr__(self):
+        return f"PackageParts({self.name!r}, {len(self)} parts)"
+
+    def copy(self):
+        """Return a copy that shares the unpacked state and the source."""
+        parts = PackageParts(source=self.source, name=self.name)
+        parts._parts = dict(self._parts)
+        parts._unpacked = self._unpacked
+        parts.formatted = set(self.formatted)
+        return parts
+
+    def is_unchanged(self, part_name):
+        """Return True if a part still has the contents it was unpacked with."""
+        unpacked = self._unpacked.get(part_name)
+        content = self._parts.get(part_name)
+        return unpacked is not None and (content is unpacked or content == unpacked)
+
+    def was_formatted(self, part_name):
+        """Return True if a part is expected in pretty-printed form.
+
+        Like PartManifest.was_formatted: parts that were pretty-printed and parts
+        added since unpacking are; parts kept verbatim are not.
+        """
+        return part_name in self.formatted or part_name not in self._unpacked
+
+    @property
+    def root(self):
+        """Path of the package root, for use where a directory path is expected."""
+        return PartPath(self, "")
+
+    def path(self, part_name):
+        """Return the path of a part."""
+        return PartPath(self, part_name)
+
+
+class PartPath:
+    """Path-like handle to a part of a PackageParts.
+
+    Supports the subset of pathlib.Path used to edit unpacked packages: joining
+    with /, name/parent/suffix, exists()/is_file()/is_dir() and reading and
+    writing bytes or text. Directories are implied by the part names.
+    """
+
+    def __init__(self, parts, part_name):
+        self.parts = parts
+        self.part_name = posixpath.normpath(part_name) if part_name else ""
+        if self.part_name == ".":
+            self.part_name = ""
+
+    def __truediv__(self, other):
+        other = Path(other).as_posix() if not isinstance(other, str) else other
+        return PartPath(self.parts, posixpath.join(self.part_name, other))
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, PartPath)
+            and other.parts is self.parts
+            and other.part_name == self.part_name
+        )
+
+    def __hash__(self):
+        return hash((id(self.parts), self.part_name))
+
+    def __str__(self):
+        return posixpath.join(f"<{self.parts.name}>", self.part_name)
+
+    def __repr__(self):
+        return f"PartPath({str(self)!r})"
+
+    @property
+    def name(self):
+        return posixpath.basename(self.part_name)
+
+    @property
+    def suffix(self):
+        return posixpath.splitext(self.name)[1]
+
+    @property
+    def parent(self):
+        return PartPath(self.parts, posixpath.dirname(self.part_name))
+
+    def as_posix(self):
+        return self.part_name
+
+    def is_file(self):
+        return self.part_name in self.parts
+
+    def is_dir(self):
+        if not self.part_name:
+            return True
+        prefix = self.part_name + "/"
+        return any(name.startswith(prefix) for name in self.parts)
+
+    def exists(self):
+        return self.is_file() or self.is_dir()
+
+    def read_bytes(self):
+        try:
+            return self.parts[self.part_name]
+        except KeyError:
+            raise FileNotFoundError(f"No such part: {self}") from None
+
+    def write_bytes(self, data):
+        self.parts[self.part_name] = data
+        return len(data)
+
+    def read_text(self, encoding="utf-8"):
+        return self.read_bytes().decode(encoding)
+
+    def write_text(self, text, encoding="utf-8"):
+        return self.write_bytes(text.encode(encoding))
+
+    def mkdir(self, parents=False, exist_ok=False):
+        """Directories exist implicitly; nothing to create."""
+
+    def unlink(self, missing_ok=False):
+        try:
+            del self.parts[self.part_name]
+        except KeyError:
+            if not missing_ok:
+                raise FileNotFoundError(f"No such part: {self}") from None
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
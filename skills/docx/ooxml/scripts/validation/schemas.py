@@ -0,0 +1,80 @@
+"""
+Process-wide registry of compiled XSD schemas.
+"""
+
+from pathlib import Path
+
+import lxml.etree
+
+
+class SchemaRegistry:
+    """Compile each XSD schema once and reuse it for every part and validator.
+
+    The OOXML schemas import dozens of other schemas, so compiling them costs far
+    more than validating a part. Schemas are keyed by their resolved path and
+    shared by all validators (DOCX, PPTX) and by both the current and original
+    trees. Compilation failures are cached too and re-raised on every lookup.
+
+    Attributes:
+        hits: Number of lookups served from the registry
+        misses: Number of lookups that compiled a schema
+    """
+
+    def __init__(self):
+        self._schemas = {}  # Path -> XMLSchema or the exception raised while compiling
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, schema_path):
+        """Return the compiled schema for an .xsd file, compiling it on first use.
+
+        Args:
+            schema_path: Path to the .xsd file
+
+        Returns:
+            lxml.etree.XMLSchema: Compiled schema
+
+        Raises:
+            lxml.etree.XMLSchemaParseError: If the schema cannot be compiled
+        """
+        key = Path(schema_path).resolve()
+        if key in self._schemas:
+            self.hits += 1
+        else:
+            self.misses += 1
+            try:
+                with open(key, "rb") as xsd_file:
+                    parser = lxml.etree.XMLParser()
+                    xsd_doc = lxml.etree.parse(
+                        xsd_file, parser=parser, base_url=str(key)
+                    )
+                    self._schemas[key] = lxml.etree.XMLSchema(xsd_doc)
+            except Exception as e:
+                self._schemas[key] = e
+
+        schema = self._schemas[key]
+        if isinstance(schema, Exception):
+            raise schema
+        return schema
+
+    def stats(self):
+        """Return hit/miss counters and the number of compiled schemas."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "compiled": len(self._schemas),
+        }
+
+    def clear(self):
+        """Drop all compiled schemas and reset the counters."""
+        self._schemas.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared by every validator in this process
+schema_registry = SchemaRegistry()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Benchmark the lxml XMLEditor engine against the minidom engine.
+
+Each engine parses the given XML part, runs the same get_node() lookups (by
+line, by w14:paraId or w:id and by text) and saves the part to a temporary file. Every
+engine runs in a fresh process so its peak memory can be measured. Both engines
+must find the same elements and write the same XML (compared in canonical
+form); the script exits with status 1 otherwise.
+
+Example usage:
+    python bench_editor.py <unpacked_dir>/word/document.xml [--lookups N]
+"""
+
+import argparse
+import hashlib
+import json
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import lxml.etree
+
+from utilities import XMLEditor
+
+ENGINES = ("minidom", "lxml")
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the minidom and lxml XMLEditor engines"
+    )
+    parser.add_argument("xml_file", help="XML part to edit (e.g. word/document.xml)")
+    parser.add_argument(
+        "--lookups", type=int, default=200, help="get_node() calls per lookup kind"
+    )
+    parser.add_argument("--engine", choices=ENGINES, help=argparse.SUPPRESS)
+    parser.add_argument("--queries", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.engine:
+        # Child process: run one engine and report as JSON
+        queries = json.loads(Path(args.queries).read_text())
+        print(json.dumps(_run_engine(args.xml_file, args.engine, queries)))
+        return
+
+    queries = _sample_queries(args.xml_file, args.lookups)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        queries_file = Path(temp_dir) / "queries.json"
+        queries_file.write_text(json.dumps(queries))
+        results = {}
+        for engine in ENGINES:
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    args.xml_file,
+                    "--engine",
+                    engine,
+                    "--queries",
+                    str(queries_file),
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            results[engine] = json.loads(output)
+
+    size = Path(args.xml_file).stat().st_size
+    print(f"{args.xml_file}: {size / 1024:.1f} KiB")
+    for step in ("parse", "line", "attrs", "contains", "save"):
+        minidom_time = results["minidom"]["times"][step]
+        lxml_time = results["lxml"]["times"][step]
+        speedup = minidom_time / lxml_time if lxml_time else float("inf")
+        count = len(queries[step]) if step in queries else 1
+        print(
+            f"{step:>8} ({count:>4}): minidom {minidom_time * 1000:8.1f}ms  "
+            f"lxml {lxml_time * 1000:8.1f}ms  ({speedup:.1f}x)"
+        )
+    print(
+        f"  memory: minidom {results['minidom']['memory'] / 1024:8.1f}MiB  "
+        f"lxml {results['lxml']['memory'] / 1024:8.1f}MiB"
+    )
+
+    mismatches = []
+    for step in ("line", "attrs", "contains"):
+        if results["minidom"]["found"][step] != results["lxml"]["found"][step]:
+            mismatches.append(f"{step} lookups")
+    if results["minidom"]["output"] != results["lxml"]["output"]:
+        mismatches.append("saved XML")
+    if mismatches:
+        print(f"FAILED - Engines differ: {', '.join(mismatches)}")
+        sys.exit(1)
+    print("PASSED - Both engines find the same elements and write the same XML")
+
+
+def _sample_queries(xml_file, count):
+    """Pick lookups spread over the part: (tag, line), (tag, id attribute, value), (tag, text)."""
+    tree = lxml.etree.parse(xml_file)
+    elements = [e for e in tree.getroot().iter(lxml.etree.Element) if e.prefix]
+    paragraphs = [e for e in elements if _qualified_name(e) == "w:p"]
+    id_attributes = {
+        "w14:paraId": "{http://schemas.microsoft.com/office/word/2010/wordml}paraId",
+        "w:id": f"{{{W_NAMESPACE}}}id",
+    }
+    text_tag = f"{{{W_NAMESPACE}}}t"
+
+    def spread(items):
+        step = max(len(items) // max(count, 1), 1)
+        return items[::step][:count]
+
+    return {
+        "line": [[_qualified_name(e), e.sourceline] for e in spread(elements)],
+        "attrs": [
+            [_qualified_name(e), name, e.get(attribute)]
+            for name, attribute in id_attributes.items()
+            for e in spread([e for e in elements if e.get(attribute)])
+        ][:count],
+        "contains": [
+            ["w:p", text[:30]]
+            for text in spread(
+                ["".join(t.text or "" for t in p.iter(text_tag)) for p in paragraphs]
+            )
+            if text[:30].strip()
+        ],
+    }
+
+
+def _run_engine(xml_file, engine, queries):
+    """Time one engine; return timings, lookup results, output digest and memory."""
+    memory_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    times = {}
+    found = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_file = Path(temp_dir) / Path(xml_file).name
+        shutil.copyfile(xml_file, work_file)
+
+        start = time.perf_counter()
+        editor = XMLEditor(work_file, engine=engine)
+        times["parse"] = time.perf_counter() - start
+
+        lookups = {
+            "line": lambda tag, line: {"tag": tag, "line_number": line},
+            "attrs": lambda tag, name, value: {"tag": tag, "attrs": {name: value}},
+            "contains": lambda tag, text: {"tag": tag, "contains": text},
+        }
+        for step, make_query in lookups.items():
+            found[step] = []
+            start = time.perf_counter()
+            for query in queries[step]:
+                try:
+                    elem = editor.get_node(**make_query(*query))
+                    found[step].append(_line_of(elem))
+                except ValueError:
+                    found[step].append(None)
+            times[step] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        editor.save()
+        times["save"] = time.perf_counter() - start
+        canonical = lxml.etree.tostring(lxml.etree.parse(str(work_file)), method="c14n")
+
+    memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - memory_before
+    if sys.platform == "darwin":
+        memory //= 1024  # ru_maxrss is in bytes on macOS, KiB elsewhere
+    return {
+        "times": times,
+        "found": found,
+        "output": hashlib.sha256(canonical).hexdigest(),
+        "memory": memory,
+    }
+
+
+def _line_of(elem):
+    """Return the original line of an element of either engine."""
+    if hasattr(elem, "sourceline"):
+        return elem.sourceline
+    return getattr(elem, "parse_position", (None,))[0]
+
+
+def _qualified_name(elem):
+    return f"{elem.prefix}:{lxml.etree.QName(elem).localname}"
+
+
+if __name__ == "__main__":
+    main()
@@ -24,25 +24,56 @@ Usage:
 
     # Save
     doc.save()
+
+    # Edit an Office file held in memory, without touching the disk
+    from ooxml.scripts.pack import pack_bytes
+    from ooxml.scripts.unpack import unpack_bytes
+
+    parts = unpack_bytes(docx_bytes)
+    doc = Document(parts)
+    ...
+    doc.save()
+    docx_bytes = pack_bytes(parts)
 """
 
 import html
+import os
 import random
 import shutil
+import sys
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
+from ooxml.scripts.pack import pack_bytes, pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
+from ooxml.scripts.validation.manifest import materialize_parts
+from ooxml.scripts.validation.parts import PackageParts
 from ooxml.scripts.validation.redlining import RedliningValidator
 
 from .utilities import XMLEditor
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl request cloning a file's extents (linux/fs.h)
+_FICLONE = 0x40049409
+
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Parts Document reads or updates besides the ones opened through doc[...]
+INFRASTRUCTURE_PARTS = [
+    "[[]Content_Types].xml",
+    "word/_rels/document.xml.rels",
+    "word/settings.xml",
+    "word/people.xml",
+    "word/comments*.xml",
+]
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -71,20 +102,51 @@ class DocxXMLEditor(XMLEditor):
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        # Next free w:id for tracked changes, found by a scan on first use
+        self._next_change_id = None
+        # Nodes awaiting attribute injection while a Document.batch() is open
+        self._deferred_nodes = None
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Allocate the next available change ID.
+
+        The first call scans all tracked change elements; later calls count on.
+        """
+        if self._next_change_id is None:
+            max_id = -1
+            for tag in ("w:ins", "w:del"):
+                elements = self.dom.getElementsByTagName(tag)
+                for elem in elements:
+                    change_id = elem.getAttribute("w:id")
+                    if change_id:
+                        try:
+                            max_id = max(max_id, int(change_id))
+                        except ValueError:
+                            pass
+            self._next_change_id = max_id + 1
+        change_id = self._next_change_id
+        self._next_change_id += 1
+        return change_id
+
+    def _reserve_change_id(self, change_id):
+        """Keep the change ID counter above an ID already used in the document."""
+        try:
+            change_id = int(change_id)
+        except ValueError:
+            return
+        if self._next_change_id is not None and change_id >= self._next_change_id:
+            self._next_change_id = change_id + 1
+
+    def _defer_attributes(self):
+        """Queue nodes for attribute injection until _apply_deferred_attributes()."""
+        if self._deferred_nodes is None:
+            self._deferred_nodes = []
+
+    def _apply_deferred_attributes(self):
+        """Inject attributes into the queued nodes in one pass and stop deferring."""
+        nodes, self._deferred_nodes = self._deferred_nodes, None
+        if nodes:
+            self._inject_attributes_to_nodes(nodes)
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
@@ -124,22 +186,24 @@ class DocxXMLEditor(XMLEditor):
         - w:comment: gets w:author, w:date, w:initials
         - w16cex:commentExtensible: gets w16cex:dateUtc
 
+        Each node's subtree is traversed once. Inside a Document.batch() the
+        nodes are only queued; the batch injects into all of them when it
+        commits, skipping nodes removed since and nodes within other queued
+        nodes.
+
         Args:
             nodes: List of DOM nodes to process
         """
+        if self._deferred_nodes is not None:
+            self._deferred_nodes.extend(nodes)
+            # Lookups within the batch still see changed text and structure
+            self.reindex(nodes)
+            return
+
         from datetime import datetime, timezone
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        def is_inside_deletion(elem):
-            """Check if element is inside a w:del element."""
-            parent = elem.parentNode
-            while parent:
-                if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
-                    return True
-                parent = parent.parentNode
-            return False
-
         def add_rsid_to_p(elem):
             if not elem.hasAttribute("w:rsidR"):
                 elem.setAttribute("w:rsidR", self.rsid)
@@ -155,9 +219,9 @@ class DocxXMLEditor(XMLEditor):
                 self._ensure_w14_namespace()
                 elem.setAttribute("w14:textId", _generate_hex_id())
 
-        def add_rsid_to_r(elem):
+        def add_rsid_to_r(elem, inside_deletion):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
+            if inside_deletion:
                 if not elem.hasAttribute("w:rsidDel"):
                     elem.setAttribute("w:rsidDel", self.rsid)
             else:
@@ -168,6 +232,8 @@ class DocxXMLEditor(XMLEditor):
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
                 elem.setAttribute("w:id", str(self._get_next_change_id()))
+            else:
+                self._reserve_change_id(elem.getAttribute("w:id"))
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -204,38 +270,50 @@ class DocxXMLEditor(XMLEditor):
                     if not elem.hasAttribute("xml:space"):
                         elem.setAttribute("xml:space", "preserve")
 
-        for node in nodes:
-            if node.nodeType != node.ELEMENT_NODE:
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
+
+        elements = [node for node in nodes if node.nodeType == node.ELEMENT_NODE]
+        queued = set(elements)
+        injected = []
+        for node in dict.fromkeys(elements):
+            # Skip nodes removed from the document or within another queued node,
+            # and find out whether the node is inside a deletion
+            inside_deletion = False
+            parent = node.parentNode
+            while parent is not None and parent is not self.dom:
+                if parent in queued:
+                    break
+                if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
+                    inside_deletion = True
+                parent = parent.parentNode
+            if parent is not self.dom:
                 continue
+            injected.append(node)
+
+            # Handle the node and its descendants in one traversal
+            stack = [(node, inside_deletion)]
+            while stack:
+                elem, inside_deletion = stack.pop()
+                if elem.tagName == "w:r":
+                    add_rsid_to_r(elem, inside_deletion)
+                elif elem.tagName in handlers:
+                    handlers[elem.tagName](elem)
+                inside_deletion = inside_deletion or elem.tagName == "w:del"
+                stack.extend(
+                    (child, inside_deletion)
+                    for child in reversed(elem.childNodes)
+                    if child.nodeType == child.ELEMENT_NODE
+                )
 
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
+        # New w:id and w14:paraId values, and nodes created through the DOM
+        self.reindex(injected)
 
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
@@ -556,6 +634,7 @@ class DocxXMLEditor(XMLEditor):
                 rPr.insertBefore(
                     del_marker, rPr.firstChild
                 ) if rPr.firstChild else rPr.appendChild(del_marker)
+                self.reindex([rPr])
 
             # Convert w:t → w:delText in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
@@ -593,6 +672,141 @@ class DocxXMLEditor(XMLEditor):
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class _Batch:
+    """A batch of edits to a Document, as a context manager; see Document.batch()."""
+
+    def __init__(self, document, validate):
+        self.document = document
+        self.validate = validate
+        # Parts created from templates during the batch
+        self.created_parts = []
+        # Content of the parts overwritten when committing, to roll back
+        self.overwritten = {}
+
+    def __enter__(self):
+        doc = self.document
+        if doc._batch is not None:
+            raise RuntimeError("A batch is already open for this document")
+
+        # Write pending changes so the working copy holds the state to roll back to
+        doc._save_editors()
+        self.modified_parts = set(doc._modified_parts)
+        self.next_comment_id = doc.next_comment_id
+        self.existing_comments = {
+            comment_id: dict(info) for comment_id, info in doc.existing_comments.items()
+        }
+
+        for editor in doc._editors.values():
+            editor._defer_attributes()
+        doc._batch = self
+        return doc
+
+    def __exit__(self, exc_type, exc, traceback):
+        try:
+            if exc_type is not None:
+                self._rollback()
+            else:
+                try:
+                    self._commit()
+                except BaseException:
+                    self._rollback()
+                    raise
+        finally:
+            for editor in self.document._editors.values():
+                editor._deferred_nodes = None
+            self.document._batch = None
+        return False
+
+    def _commit(self):
+        doc = self.document
+        if self.validate:
+            doc._ensure_comment_parts()
+        for editor in list(doc._editors.values()):
+            editor._apply_deferred_attributes()
+        if not self.validate:
+            return
+
+        previous = {
+            xml_path: editor.xml_path.read_bytes()
+            for xml_path, editor in doc._editors.items()
+            if xml_path not in self.created_parts
+        }
+        for xml_path in doc._save_editors():
+            if xml_path in previous:
+                self.overwritten[xml_path] = previous[xml_path]
+        doc.validate()
+
+    def _rollback(self):
+        doc = self.document
+        for xml_path, editor in list(doc._editors.items()):
+            if xml_path in self.created_parts:
+                del doc._editors[xml_path]
+            elif xml_path in self.overwritten:
+                # The file was replaced when committing, so it is not shared
+                # with the original and can be written in place
+                content = self.overwritten[xml_path]
+                editor.xml_path.write_bytes(content)
+                editor._parse(content)
+            elif editor._unsaved_content() is not None:
+                editor._parse(editor.xml_path.read_bytes())
+        for part_name in self.created_parts:
+            (doc.unpacked_path / part_name).unlink(missing_ok=True)
+
+        doc._modified_parts = self.modified_parts
+        doc.next_comment_id = self.next_comment_id
+        doc.existing_comments = self.existing_comments
+
+
+def _link_or_copy(source, destination):
+    """
+    Copy a file into a working copy, sharing its data with the source if possible.
+
+    Tries a reflink (a copy-on-write clone, on filesystems such as Btrfs and
+    XFS), then a hard link, and copies the file if neither is possible (e.g.
+    across filesystems). Hard-linked files must only be replaced, never written
+    into, which XMLEditor.save() guarantees.
+    """
+    try:
+        _reflink(source, destination)
+        return destination
+    except OSError:
+        pass
+    try:
+        os.link(source, destination)
+        return destination
+    except OSError:
+        return shutil.copy2(source, destination)
+
+
+def _reflink(source, destination):
+    """Clone a file with the Linux FICLONE ioctl. Raises OSError if unsupported."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        raise OSError("reflinks are not supported on this platform")
+    with open(source, "rb") as src, open(destination, "xb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            os.unlink(destination)
+            raise
+    shutil.copystat(source, destination)
+
+
+def _replace_file(source, destination):
+    """Copy a file over another by atomically replacing it, creating directories."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(
+        dir=destination.parent, prefix=f".{destination.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        shutil.copy2(source, temp_path)
+        os.replace(temp_path, destination)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -625,25 +839,42 @@ class Document:
         Automatically sets up comment infrastructure (people.xml, RSIDs).
 
         Args:
-            unpacked_dir: Path to unpacked DOCX directory (must contain word/ subdirectory)
+            unpacked_dir: Path to unpacked DOCX directory (must contain word/ subdirectory),
+                or a PackageParts from unpack_bytes() to work entirely in memory
             rsid: Optional RSID to use for all comment elements. If not provided, one will be generated.
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
         """
-        self.original_path = Path(unpacked_dir)
-
-        if not self.original_path.exists() or not self.original_path.is_dir():
-            raise ValueError(f"Directory not found: {unpacked_dir}")
-
-        # Create temporary directory with subdirectories for unpacked content and baseline
-        self.temp_dir = tempfile.mkdtemp(prefix="docx_")
-        self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        # Validation baseline, packed on first use (see original_docx)
+        self._original_docx = None
+
+        if isinstance(unpacked_dir, PackageParts):
+            # In-memory package: edit a copy of the parts and keep another as the
+            # baseline (copies share the part contents); nothing is written to disk
+            self.original_path = unpacked_dir
+            self.temp_dir = None
+            self._parts = unpacked_dir.copy()
+            self._baseline_parts = unpacked_dir.copy()
+            self.unpacked_path = self._parts.root
+        else:
+            self.original_path = Path(unpacked_dir)
+            self._parts = None
+
+            if not self.original_path.exists() or not self.original_path.is_dir():
+                raise ValueError(f"Directory not found: {unpacked_dir}")
+
+            # Create temporary directory with subdirectories for unpacked content and baseline.
+            # Files of the working copy share their data with the original until
+            # they are replaced (editors replace files rather than write into them)
+            self.temp_dir = tempfile.mkdtemp(prefix="docx_")
+            self.unpacked_path = Path(self.temp_dir) / "unpacked"
+            shutil.copytree(
+                self.original_path, self.unpacked_path, copy_function=_link_or_copy
+            )
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+            # Extract the parts edited below if a lazy unpack left them in the source
+            materialize_parts(self.unpacked_path, INFRASTRUCTURE_PARTS)
 
         self.word_path = self.unpacked_path / "word"
 
@@ -658,6 +889,12 @@ class Document:
         # Cache for lazy-loaded editors
         self._editors = {}
 
+        # Parts written since initialization; save() copies only these back
+        self._modified_parts = set()
+
+        # Open batch of edits (see batch())
+        self._batch = None
+
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
@@ -677,6 +914,20 @@ class Document:
         # Add author to people.xml
         self._add_author_to_people(author)
 
+    @property
+    def original_docx(self):
+        """
+        The original document packed as a .docx, the baseline for validation.
+
+        Packed on first use, as most documents are opened for a few edits and
+        only validated when saved: a path to original.docx in the temporary
+        directory (outside the unpacked directory), or bytes for an in-memory
+        document.
+        """
+        if self._original_docx is None:
+            self._pack_baseline()
+        return self._original_docx
+
     def __getitem__(self, xml_path: str) -> DocxXMLEditor:
         """
         Get or create a DocxXMLEditor for the specified XML file.
@@ -702,14 +953,52 @@ class Document:
         """
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
+            if not file_path.exists() and self._parts is None:
+                materialize_parts(self.unpacked_path, [xml_path])
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
             self._editors[xml_path] = DocxXMLEditor(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
+            if self._batch is not None:
+                self._editors[xml_path]._defer_attributes()
         return self._editors[xml_path]
 
+    def batch(self, validate=True):
+        """
+        Group edits into a batch that is applied as a whole or not at all.
+
+        Inside the batch, editing methods (replace_node, insert_*, append_to,
+        suggest_deletion, revert_*, add_comment, reply_to_comment) change the
+        DOM right away and return nodes as usual, but RSIDs, authors, dates and
+        change IDs are injected in a single pass over all new content when the
+        batch ends. Until then, new elements have no w:id or w14:paraId to look
+        them up by.
+
+        When the block ends normally the batch commits: attributes are
+        injected and, if validate is True, the parts are written to the
+        working copy and validated. If the block raises or validation fails,
+        every part, the comment counters and the files created by the batch
+        are rolled back to their state when the batch started, and the
+        exception propagates.
+
+        Args:
+            validate: If True, validates the document when the batch commits
+                (default: True)
+
+        Raises:
+            RuntimeError: If a batch is already open
+            ValueError: If validation fails (after rolling back)
+
+        Example:
+            with doc.batch():
+                for node in nodes_to_delete:
+                    doc["word/document.xml"].suggest_deletion(node)
+                doc.add_comment(start=first, end=last, text="Removed clauses")
+        """
+        return _Batch(self, validate)
+
     def add_comment(self, start, end, text: str) -> int:
         """
         Add a comment spanning from one element to another.
@@ -832,7 +1121,7 @@ class Document:
 
     def __del__(self):
         """Clean up temporary directory on deletion."""
-        if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
+        if getattr(self, "temp_dir", None) and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
     def validate(self) -> None:
@@ -843,11 +1132,12 @@ class Document:
             ValueError: If validation fails.
         """
         # Create validators with current state
+        unpacked = self._parts if self._parts is not None else self.unpacked_path
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            unpacked, self.original_docx, verbose=False
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            unpacked, self.original_docx, verbose=False
         )
 
         # Run validations
@@ -861,30 +1151,115 @@ class Document:
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only loaded parts whose tree changed are written. Saving to the original
+        directory (or PackageParts) writes only the files that differ from it,
+        including files added or replaced in unpacked_path by other means (such
+        as images); any other destination receives the whole package.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
+                For an in-memory document, an optional PackageParts to save to; if None,
+                the PackageParts the document was opened with is updated.
             validate: If True, validates document before saving (default: True).
+
+        Raises:
+            RuntimeError: If called inside a batch
         """
-        # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
-            self._ensure_comment_relationships()
-            self._ensure_comment_content_types()
+        if self._batch is not None:
+            raise RuntimeError("Cannot save a document while a batch is open")
+
+        self._ensure_comment_parts()
 
-        # Save all modified XML files in temp directory
-        for editor in self._editors.values():
-            editor.save()
+        # Save modified XML files in temp directory
+        self._save_editors()
 
         # Validate by default
         if validate:
             self.validate()
 
+        if self._parts is not None:
+            # Copy parts to the destination (or the original) package in memory
+            if destination is None or destination is self.original_path:
+                self.original_path.update(
+                    {name: self._parts[name] for name in self._changed_parts()}
+                )
+            else:
+                destination.update(self._parts)
+            return
+
         # Copy contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if target_path.resolve() != self.original_path.resolve():
+            shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+            return
+
+        if self._original_docx is None:
+            # The baseline is packed from the original directory, which is
+            # about to change
+            self._pack_baseline()
+        for part_name in self._changed_parts():
+            _replace_file(self.unpacked_path / part_name, target_path / part_name)
 
     # ==================== Private: Initialization ====================
 
+    def _ensure_comment_parts(self):
+        """Add comment relationships and content types if comment files exist."""
+        if self.comments_path.exists():
+            self._ensure_comment_relationships()
+            self._ensure_comment_content_types()
+
+    def _save_editors(self):
+        """Write the editors whose tree changed to the working copy, returning their parts."""
+        saved = []
+        for xml_path, editor in self._editors.items():
+            if editor.save_if_modified():
+                self._modified_parts.add(xml_path)
+                saved.append(xml_path)
+        return saved
+
+    def _changed_parts(self):
+        """
+        Return the names of the working copy's files that differ from the original.
+
+        Includes the parts written by editors and any file added or replaced in
+        the working copy by other means. Files on disk are compared by size and
+        modification time, which linking and copying preserve; in-memory
+        parts by content.
+        """
+        changed = set(self._modified_parts)
+        if self._parts is not None:
+            for name, content in self._parts.items():
+                original = self.original_path.get(name)
+                if original is not content and original != content:
+                    changed.add(name)
+            return sorted(changed)
+
+        for path in self.unpacked_path.rglob("*"):
+            if not path.is_file():
+                continue
+            name = path.relative_to(self.unpacked_path).as_posix()
+            try:
+                original = (self.original_path / name).stat()
+            except FileNotFoundError:
+                changed.add(name)
+                continue
+            current = path.stat()
+            if (current.st_size, current.st_mtime_ns) != (
+                original.st_size,
+                original.st_mtime_ns,
+            ):
+                changed.add(name)
+        return sorted(changed)
+
+    def _pack_baseline(self):
+        """Pack the original document for original_docx."""
+        if self._parts is not None:
+            self._original_docx = pack_bytes(self._baseline_parts)
+        else:
+            original_docx = Path(self.temp_dir) / "original.docx"
+            pack_document(self.original_path, original_docx, validate=False)
+            self._original_docx = original_docx
+
     def _get_next_comment_id(self):
         """Get the next available comment ID."""
         if not self.comments_path.exists():
@@ -954,8 +1329,7 @@ class Document:
     def _update_people_xml(self, path):
         """Create people.xml if it doesn't exist."""
         if not path.exists():
-            # Copy from template
-            shutil.copy(TEMPLATE_DIR / "people.xml", path)
+            self._create_from_template("word/people.xml")
 
     def _add_content_type_for_people(self, path):
         """Add people.xml content type to [Content_Types].xml if not already present."""
@@ -1065,12 +1439,20 @@ class Document:
 
     # ==================== Private: XML File Creation ====================
 
+    def _create_from_template(self, part_name):
+        """Create a part from the template file of the same name."""
+        path = self.unpacked_path / part_name
+        path.write_bytes((TEMPLATE_DIR / path.name).read_bytes())
+        self._modified_parts.add(part_name)
+        if self._batch is not None:
+            self._batch.created_parts.append(part_name)
+
     def _add_to_comments_xml(
         self, comment_id, para_id, text, author, initials, timestamp
     ):
         """Add a single comment to comments.xml."""
         if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
+            self._create_from_template("word/comments.xml")
 
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
@@ -1091,9 +1473,7 @@ class Document:
     def _add_to_comments_extended_xml(self, para_id, parent_para_id):
         """Add a single comment to commentsExtended.xml."""
         if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
-            )
+            self._create_from_template("word/commentsExtended.xml")
 
         editor = self["word/commentsExtended.xml"]
         root = editor.get_node(tag="w15:commentsEx")
@@ -1107,7 +1487,7 @@ class Document:
     def _add_to_comments_ids_xml(self, para_id, durable_id):
         """Add a single comment to commentsIds.xml."""
         if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
+            self._create_from_template("word/commentsIds.xml")
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
@@ -1118,9 +1498,7 @@ class Document:
     def _add_to_comments_extensible_xml(self, durable_id):
         """Add a single comment to commentsExtensible.xml."""
         if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
-            )
+            self._create_from_template("word/commentsExtensible.xml")
 
         editor = self["word/commentsExtensible.xml"]
         root = editor.get_node(tag="w16cex:commentsExtensible")
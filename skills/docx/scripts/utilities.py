@@ -16,6 +16,10 @@ Example usage:
     # Find node by text content
     elem = editor.get_node(tag="w:p", contains="specific text")
 
+    # Find text, also where it is split across runs
+    for para, t_elems in editor.find_text("specific text"):
+        runs = [t.parentNode for t in t_elems]
+
     # Find node by attributes
     elem = editor.get_node(tag="w:r", attrs={"w:id": "target"})
 
@@ -30,12 +34,32 @@ Example usage:
     editor.save()
 """
 
+import bisect
+import hashlib
 import html
+import io
+import os
+import tempfile
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+# Attributes identifying elements; get_node looks their values up in an index
+INDEXED_ATTRIBUTES = ("w:id", "w14:paraId", "r:id")
+
+# Elements that only occur inside w:p, so contains= lookups for them can use
+# the paragraph text index
+_PARAGRAPH_CONTENT_TAGS = frozenset(
+    ("w:p", "w:r", "w:t", "w:delText", "w:instrText", "w:hyperlink", "w:ins", "w:del")
+)
+
+# Length of the substrings indexed by the paragraph text index
+_NGRAM_SIZE = 3
+
+_XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
 
 
 class XMLEditor:
@@ -46,32 +70,73 @@ class XMLEditor:
     of each element. This enables finding nodes by their line number in the original
     file, which is useful when working with Read tool output.
 
+    Lookups go through indexes by tag, by INDEXED_ATTRIBUTES values and by
+    original line, and contains= lookups through an n-gram index of paragraph
+    text. The indexes are built on first use and kept up to date by
+    replace_node(), insert_after(), insert_before() and append_to(). Code that
+    adds elements, sets indexed attributes or changes text through the DOM
+    directly must call reindex() on the nodes it changed.
+
+    The editing methods and reindex() set modified. save_if_modified() writes
+    flagged trees without comparing them, and serializes the others to write
+    them only if they differ from the content last read or written, so DOM
+    changes that did not set modified are still saved.
+
+    With engine="lxml" the editor is an LxmlXMLEditor, which has the same
+    methods but works on lxml elements.
+
     Attributes:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        modified: True if the tree was changed since it was parsed or saved
     """
 
-    def __init__(self, xml_path):
+    def __new__(cls, *args, engine="minidom", **kwargs):
+        if engine == "lxml" and cls is XMLEditor:
+            cls = LxmlXMLEditor
+        return super().__new__(cls)
+
+    def __init__(self, xml_path, engine="minidom"):
         """
         Initialize with path to XML file and parse with line number tracking.
 
         Args:
-            xml_path: Path to XML file to edit (str or Path)
+            xml_path: Path to XML file to edit (str or Path), or a path-like
+                object with exists(), read_bytes() and write_bytes(), such as
+                the PartPath of a part in an in-memory package
+            engine: "minidom" (default) or "lxml". The lxml engine parses large
+                parts much faster and in a fraction of the memory; its methods
+                take and return lxml elements instead of minidom nodes.
 
         Raises:
-            ValueError: If the XML file does not exist
+            ValueError: If the XML file does not exist or the engine is unknown
         """
-        self.xml_path = Path(xml_path)
+        if engine != "minidom":
+            raise ValueError(f"Unsupported engine for {type(self).__name__}: {engine}")
+        self._parse(self._read(xml_path))
+
+    def _parse(self, content):
+        """Parse content as the tree being edited, dropping the lookup indexes."""
+        parser = _create_line_tracking_parser()
+        self.dom = defusedxml.minidom.parse(io.BytesIO(content), parser)
+        self._index = None
+        self._text_index = None
+        self.modified = False
+        self._digest = hashlib.sha256(content).digest()
+
+    def _read(self, xml_path):
+        """Set xml_path and encoding, and return the file's content."""
+        if isinstance(xml_path, (str, os.PathLike)):
+            xml_path = Path(xml_path)
+        self.xml_path = xml_path
         if not self.xml_path.exists():
             raise ValueError(f"XML file not found: {xml_path}")
 
-        with open(self.xml_path, "rb") as f:
-            header = f.read(200).decode("utf-8", errors="ignore")
+        content = self.xml_path.read_bytes()
+        header = content[:200].decode("utf-8", errors="ignore")
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
-
-        parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        return content
 
     def get_node(
         self,
@@ -90,8 +155,9 @@ class XMLEditor:
             tag: The XML tag name (e.g., "w:del", "w:ins", "w:r")
             attrs: Dictionary of attribute name-value pairs to match (e.g., {"w:id": "1"})
             line_number: Line number (int) or line range (range) in original XML file (1-indexed)
-            contains: Text string that must appear in any text node within the element.
-                      Supports both entity notation (&#8220;) and Unicode characters (\u201c).
+            contains: Text string that must appear in the text of the element, which
+                      may span several runs. Supports both entity notation (&#8220;)
+                      and Unicode characters (\u201c).
 
         Returns:
             defusedxml.minidom.Element: The matching DOM element
@@ -109,12 +175,44 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and ""Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+        text_matches = self._text_matches(tag, normalized_contains)
+
+        candidates = self._candidates(tag, attrs, line_number, text_matches)
+        matches = self._filter_matches(
+            candidates, attrs, line_number, normalized_contains, text_matches
+        )
+        if not matches and tag != "*":
+            # The indexes miss elements added or given new attribute values or
+            # text through the DOM without reindex(): scan the tree, and rebuild
+            # the indexes if that finds the node
+            matches = self._filter_matches(
+                self._elements_by_tag(tag),
+                attrs,
+                line_number,
+                normalized_contains,
+                None,
+            )
+            if matches:
+                self._drop_indexes()
+                if text_matches is not None:
+                    self.reindex(matches)
+
+        return _single_match(matches, tag, attrs, line_number, contains)
+
+    def _filter_matches(self, candidates, attrs, line_number, contains, text_matches):
+        """Return the candidates matching the filters of a get_node() query.
+
+        contains must already be normalized; elements outside text_matches (if
+        not None) are taken not to contain it.
+        """
         matches = []
-        for elem in self.dom.getElementsByTagName(tag):
+        for elem in candidates:
             # Check line_number filter
             if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
+                elem_line = self._get_line(elem)
 
                 # Handle both single line number and range
                 if isinstance(line_number, range):
@@ -127,81 +225,167 @@ class XMLEditor:
             # Check attrs filter
             if attrs is not None:
                 if not all(
-                    elem.getAttribute(attr_name) == attr_value
+                    self._get_attribute(elem, attr_name) == attr_value
                     for attr_name, attr_value in attrs.items()
                 ):
                     continue
 
             # Check contains filter
             if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
+                if text_matches is not None and elem not in text_matches:
+                    continue
+                if contains not in self._get_element_text(elem):
                     continue
 
             # If all applicable filters passed, this is a match
             matches.append(elem)
+        return matches
 
-        if not matches:
-            # Build descriptive error message
-            filters = []
-            if line_number is not None:
-                line_str = (
-                    f"lines {line_number.start}-{line_number.stop - 1}"
-                    if isinstance(line_number, range)
-                    else f"line {line_number}"
-                )
-                filters.append(f"at {line_str}")
-            if attrs is not None:
-                filters.append(f"with attributes {attrs}")
-            if contains is not None:
-                filters.append(f"containing '{contains}'")
-
-            filter_desc = " ".join(filters) if filters else ""
-            base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
-
-            # Add helpful hint based on filters used
-            if contains:
-                hint = "Text may be split across elements or use different wording."
-            elif line_number:
-                hint = "Line numbers may have changed if document was modified."
-            elif attrs:
-                hint = "Verify attribute values are correct."
-            else:
-                hint = "Try adding filters (attrs, line_number, or contains)."
+    def reindex(self, nodes):
+        """
+        Update the lookup indexes for nodes added or changed outside the editor.
+
+        Indexes the nodes and their descendants, including new values of
+        indexed attributes (w:id, w14:paraId, r:id), and marks the tree as
+        modified. Removed nodes need no call.
+
+        Args:
+            nodes: List of DOM nodes
+        """
+        self.modified = True
+        if self._index is not None:
+            for node in nodes:
+                self._index.add_subtree(node)
+        if self._text_index is not None:
+            for node in nodes:
+                if node.nodeType != node.ELEMENT_NODE:
+                    node = node.parentNode
+                # Paragraphs around the node and within it
+                for elem in _ancestors(node):
+                    if elem.tagName == "w:p":
+                        self._text_index.add(elem)
+                for paragraph in _iter_elements(node):
+                    if paragraph.tagName == "w:p" and paragraph is not node:
+                        self._text_index.add(paragraph)
+
+    def find_text(self, text):
+        """
+        Find text in the paragraphs of the document, also where it spans runs.
+
+        Args:
+            text: Text to find. Supports entity notation like get_node(contains=...)
+
+        Returns:
+            list: One (paragraph, elements) tuple per occurrence, where elements
+                are the text elements (w:t, w:delText, ...) holding the text, in
+                document order. Their parentNode is the w:r.
+
+        Example:
+            for para, t_elems in editor.find_text("Agreement"):
+                runs = [t.parentNode for t in t_elems]
+        """
+        text = html.unescape(text)
+        if not text:
+            return []
+        index = self._get_text_index()
+        return [
+            (paragraph, index.elements_at(paragraph, start, start + len(text)))
+            for paragraph, start in index.search(text)
+        ]
+
+    def _candidates(self, tag, attrs, line_number, text_matches=None):
+        """Return the elements that may match a get_node() query.
+
+        Candidates come from the narrowest index that applies (text_matches if
+        given and no attribute or line index applies); they are not guaranteed
+        to match the filters, but elements no longer in the document and
+        elements with another tag are left out.
+        """
+        if tag == "*":
+            return self.dom.getElementsByTagName(tag)
+        if self._index is None:
+            self._index = _NodeIndex(self.dom)
+        candidates = self._index.candidates(tag, attrs, line_number, text_matches)
+        return [
+            elem
+            for elem in candidates
+            if elem.tagName == tag and self._is_attached(elem)
+        ]
+
+    def _elements_by_tag(self, tag):
+        """Return all elements named tag, in document order, without the indexes."""
+        return self.dom.getElementsByTagName(tag)
+
+    def _drop_indexes(self):
+        """Drop the element index, to be rebuilt from the tree on next use."""
+        self._index = None
+
+    def _is_attached(self, node):
+        """Return True if a node is still part of the document."""
+        while node is not None:
+            if node is self.dom:
+                return True
+            node = node.parentNode
+        return False
+
+    def _get_line(self, elem):
+        """Return the line of an element in the original file, or None."""
+        return getattr(elem, "parse_position", (None,))[0]
+
+    def _get_attribute(self, elem, name):
+        """Return an attribute value by qualified name, or "" if not set."""
+        return elem.getAttribute(name)
 
-            raise ValueError(f"{base_msg}. {hint}")
-        if len(matches) > 1:
-            raise ValueError(
-                f"Multiple nodes found: <{tag}>. "
-                f"Add more filters (attrs, line_number, or contains) to narrow the search."
+    def _ancestors(self, elem, stop):
+        """Yield an element and its ancestors, up to and including stop."""
+        return _ancestors(elem, stop)
+
+    def _text_matches(self, tag, text):
+        """
+        Return the elements of the paragraph text index containing text.
+
+        Returns:
+            set or None: Elements (of any tag) whose text contains text, or None
+                if the index does not apply to the query
+        """
+        if not text or tag not in _PARAGRAPH_CONTENT_TAGS:
+            return None
+        index = self._get_text_index()
+        matches = set()
+        for paragraph, start in index.search(text):
+            elements = index.elements_at(paragraph, start, start + len(text))
+            # The elements holding the whole occurrence are the common ancestors
+            # of its first and last text elements (which are contiguous)
+            last_ancestors = set(self._ancestors(elements[-1], paragraph))
+            matches.update(
+                elem
+                for elem in self._ancestors(elements[0], paragraph)
+                if elem in last_ancestors
+            )
+        return matches
+
+    def _get_text_index(self):
+        if self._text_index is None:
+            self._text_index = _TextIndex(
+                self.dom.getElementsByTagName("w:p"), _minidom_text_parts
             )
-        return matches[0]
+        return self._text_index
 
     def _get_element_text(self, elem):
         """
-        Recursively extract all text content from an element.
+        Extract all text content from an element.
 
-        Skips text nodes that contain only whitespace (spaces, tabs, newlines),
-        which typically represent XML formatting rather than document content.
+        Skips whitespace-only text nodes between elements, which represent XML
+        formatting rather than document content. Whitespace-only text of an
+        element without children (e.g. <w:t xml:space="preserve"> </w:t>) is kept.
 
         Args:
             elem: defusedxml.minidom.Element to extract text from
 
         Returns:
-            str: Concatenated text from all non-whitespace text nodes within the element
-        """
-        text_parts = []
-        for node in elem.childNodes:
-            if node.nodeType == node.TEXT_NODE:
-                # Skip whitespace-only text nodes (XML formatting)
-                if node.data.strip():
-                    text_parts.append(node.data)
-            elif node.nodeType == node.ELEMENT_NODE:
-                text_parts.append(self._get_element_text(node))
-        return "".join(text_parts)
+            str: Concatenated text from the content text nodes within the element
+        """
+        return "".join(node.data for node in _iter_text_nodes(elem))
 
     def replace_node(self, elem, new_content):
         """
@@ -222,6 +406,13 @@ class XMLEditor:
         for node in nodes:
             parent.insertBefore(node, elem)
         parent.removeChild(elem)
+        if self._index is not None:
+            self._index.remove_subtree(elem)
+        if self._text_index is not None:
+            for paragraph in _iter_elements(elem):
+                if paragraph.tagName == "w:p":
+                    self._text_index.remove(paragraph)
+        self.reindex(nodes)
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -246,6 +437,7 @@ class XMLEditor:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+        self.reindex(nodes)
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -266,6 +458,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self.reindex(nodes)
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -285,6 +478,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             elem.appendChild(node)
+        self.reindex(nodes)
         return nodes
 
     def get_next_rid(self):
@@ -304,10 +498,45 @@ class XMLEditor:
         Save the edited XML back to the file.
 
         Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        preserving the original encoding (ascii or utf-8). The file is replaced
+        rather than overwritten, so a hard link to it keeps the old content.
+        """
+        self._write(self._serialize())
+
+    def save_if_modified(self):
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        Save the edited XML if it changed since it was read or last saved.
+
+        Trees flagged as modified are saved without further checks. Others are
+        serialized and saved only if the result differs from the content last
+        read or written, which catches changes made through the DOM without
+        setting modified.
+
+        Returns:
+            True if the file was written
+        """
+        content = self._unsaved_content()
+        if content is None:
+            return False
+        self._write(content)
+        return True
+
+    def _unsaved_content(self):
+        """Return the serialized tree if it changed since read or saved, else None."""
+        content = self._serialize()
+        if not self.modified and hashlib.sha256(content).digest() == self._digest:
+            return None
+        return content
+
+    def _serialize(self):
+        """Return the tree serialized in the original encoding."""
+        return self.dom.toxml(encoding=self.encoding)
+
+    def _write(self, content):
+        """Write serialized content to the file and mark the tree as saved."""
+        _write_file(self.xml_path, content)
+        self._digest = hashlib.sha256(content).digest()
+        self.modified = False
 
     def _parse_fragment(self, xml_content):
         """
@@ -343,6 +572,704 @@ class XMLEditor:
         return nodes
 
 
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by lxml, created with XMLEditor(xml_path, engine="lxml").
+
+    Parses with a hardened lxml parser (no entity expansion, DTD loading or
+    network access) and uses lxml's native sourceline for line lookups, instead
+    of a DOM with a position tuple on every element. This is much faster and
+    smaller for large parts.
+
+    get_node(), replace_node(), insert_after(), insert_before(), append_to(),
+    find_text(), get_next_rid() and save() behave as in XMLEditor, except that
+    they take and return lxml elements. Text between inserted elements is kept
+    but, as lxml has no text nodes, not returned. Prefixed names such as "w:p"
+    are resolved with the namespace declarations of the document.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml.etree.ElementTree
+        root: Root element of the tree
+        modified: True if the tree was changed since it was parsed or saved
+    """
+
+    def __init__(self, xml_path, engine="lxml"):
+        """
+        Initialize with path to XML file and parse it with lxml.
+
+        Args:
+            xml_path: Path to XML file to edit, as for XMLEditor
+            engine: Must be "lxml"
+
+        Raises:
+            ValueError: If the XML file does not exist
+        """
+        if engine != "lxml":
+            raise ValueError(f"Unsupported engine for {type(self).__name__}: {engine}")
+        self._parse(self._read(xml_path))
+
+    def _parse(self, content):
+        """Parse content as the tree being edited, dropping the lookup indexes."""
+        self.tree = lxml.etree.ElementTree(
+            lxml.etree.fromstring(content, _create_lxml_parser())
+        )
+        self.root = self.tree.getroot()
+        self._namespaces = None
+        self._namespaces_complete = False
+        self._lines = None
+        # (attribute, value) -> elements, for INDEXED_ATTRIBUTES; built lazily
+        self._attrs = None
+        self._text_index = None
+        self.modified = False
+        self._digest = hashlib.sha256(content).digest()
+
+    def reindex(self, nodes):
+        """
+        Update the attribute and paragraph text indexes for elements added or
+        changed outside the editor. See XMLEditor.reindex().
+
+        Args:
+            nodes: List of lxml elements
+        """
+        self.modified = True
+        if self._attrs is not None:
+            for node in nodes:
+                self._index_attributes(node.iter(lxml.etree.Element))
+        paragraph_tag = self._clark("w:p")
+        if self._text_index is None or paragraph_tag is None:
+            return
+        for node in nodes:
+            # Paragraphs around the element and within it
+            for paragraph in node.iterancestors(paragraph_tag):
+                self._text_index.add(paragraph)
+            for paragraph in node.iter(paragraph_tag):
+                self._text_index.add(paragraph)
+
+    def replace_node(self, elem, new_content):
+        """
+        Replace an element with new XML content.
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        tail = elem.tail
+        elements = self._insert_before(elem, new_content)
+        elements[-1].tail = _join_text(elements[-1].tail, tail)
+        elem.getparent().remove(elem)
+        if self._attrs is not None:
+            self._index_attributes(elem.iter(lxml.etree.Element), remove=True)
+        paragraph_tag = self._clark("w:p")
+        if self._text_index is not None and paragraph_tag is not None:
+            for paragraph in elem.iter(paragraph_tag):
+                self._text_index.remove(paragraph)
+        self.reindex(elements)
+        return elements
+
+    def insert_after(self, elem, xml_content):
+        """
+        Insert XML content after an element.
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        leading, elements = self._parse_fragment(xml_content)
+        # The text that followed elem now follows the inserted content
+        tail = elem.tail
+        elem.tail = leading
+        anchor = elem
+        for child in elements:
+            anchor.addnext(child)
+            anchor = child
+        elements[-1].tail = _join_text(elements[-1].tail, tail)
+        self.reindex(elements)
+        return elements
+
+    def insert_before(self, elem, xml_content):
+        """
+        Insert XML content before an element.
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        elements = self._insert_before(elem, xml_content)
+        self.reindex(elements)
+        return elements
+
+    def append_to(self, elem, xml_content):
+        """
+        Append XML content as children of an element.
+
+        Returns:
+            List[lxml.etree._Element]: All inserted elements
+        """
+        leading, elements = self._parse_fragment(xml_content)
+        if len(elem):
+            elem[-1].tail = _join_text(elem[-1].tail, leading)
+        else:
+            elem.text = _join_text(elem.text, leading)
+        elem.extend(elements)
+        self.reindex(elements)
+        return elements
+
+    def get_next_rid(self):
+        """Get the next available rId for relationships files."""
+        max_id = 0
+        rel_tag = self._clark("Relationship")
+        for rel_elem in self.root.iter(rel_tag) if rel_tag else ():
+            rel_id = rel_elem.get("Id", "")
+            if rel_id.startswith("rId"):
+                try:
+                    max_id = max(max_id, int(rel_id[3:]))
+                except ValueError:
+                    pass
+        return f"rId{max_id + 1}"
+
+    def _serialize(self):
+        """
+        Return the tree serialized in the original encoding.
+
+        Writes the same XML declaration as XMLEditor.save().
+        """
+        declaration = f'<?xml version="1.0" encoding="{self.encoding}"?>'
+        content = lxml.etree.tostring(
+            self.tree, encoding=self.encoding, xml_declaration=False
+        )
+        return declaration.encode("ascii") + content
+
+    def _insert_before(self, elem, xml_content):
+        """Insert XML content before an element without updating the text index."""
+        leading, elements = self._parse_fragment(xml_content)
+        previous = elem.getprevious()
+        if previous is not None:
+            previous.tail = _join_text(previous.tail, leading)
+        else:
+            parent = elem.getparent()
+            parent.text = _join_text(parent.text, leading)
+        for child in elements:
+            elem.addprevious(child)
+        return elements
+
+    def _candidates(self, tag, attrs, line_number, text_matches=None):
+        """Return the elements named tag that may match a get_node() query."""
+        clark = self._clark(tag)
+        if clark is None:
+            return []
+        prefix = tag.rpartition(":")[0] or None
+
+        if attrs:
+            for attr_name in INDEXED_ATTRIBUTES:
+                # An empty value also matches elements without the attribute
+                if attrs.get(attr_name) and self._clark(attr_name, True):
+                    candidates = [
+                        elem
+                        for elem in self._get_attribute_index().get(
+                            (attr_name, attrs[attr_name]), ()
+                        )
+                        if elem.tag == clark and self._is_attached(elem)
+                    ]
+                    break
+            else:
+                candidates = self.root.iter(clark)
+        elif isinstance(line_number, int) or (
+            isinstance(line_number, range) and line_number.step == 1
+        ):
+            lines, elems = self._get_line_index().get(clark, ((), ()))
+            if isinstance(line_number, range):
+                start, stop = line_number.start, line_number.stop
+            else:
+                start, stop = line_number, line_number + 1
+            candidates = [
+                elem
+                for elem in elems[
+                    bisect.bisect_left(lines, start) : bisect.bisect_left(lines, stop)
+                ]
+                if self._is_attached(elem)
+            ]
+        elif text_matches is not None:
+            candidates = [
+                elem
+                for elem in text_matches
+                if elem.tag == clark and self._is_attached(elem)
+            ]
+        else:
+            candidates = self.root.iter(clark)
+
+        # minidom matches qualified names; keep elements with another prefix out
+        return [elem for elem in candidates if elem.prefix == prefix]
+
+    def _elements_by_tag(self, tag):
+        clark = self._clark(tag)
+        if clark is None:
+            return []
+        prefix = tag.rpartition(":")[0] or None
+        return [elem for elem in self.root.iter(clark) if elem.prefix == prefix]
+
+    def _drop_indexes(self):
+        self._lines = None
+        self._attrs = None
+
+    def _get_attribute_index(self):
+        """Return {(attribute, value): elements} for INDEXED_ATTRIBUTES.
+
+        Entries may go stale (removed elements, changed values); callers
+        re-check every candidate against the query.
+        """
+        if self._attrs is None:
+            self._attrs = {}
+            self._index_attributes(self.root.iter(lxml.etree.Element))
+        return self._attrs
+
+    def _index_attributes(self, elems, remove=False):
+        """Add elements to the attribute index, or remove them from it."""
+        names = self._indexed_attribute_names()
+        for elem in elems:
+            for attr_name, attribute in names:
+                value = elem.get(attribute)
+                if not value:
+                    continue
+                if remove:
+                    self._attrs.get((attr_name, value), {}).pop(elem, None)
+                else:
+                    # Dicts with None values serve as insertion-ordered sets
+                    self._attrs.setdefault((attr_name, value), {})[elem] = None
+
+    def _indexed_attribute_names(self):
+        """Return (name, lxml name) for the INDEXED_ATTRIBUTES whose prefix is declared."""
+        names = []
+        for attr_name in INDEXED_ATTRIBUTES:
+            attribute = self._clark(attr_name, attribute=True)
+            if attribute is not None:
+                names.append((attr_name, attribute))
+        return names
+
+    def _get_line_index(self):
+        """Return {tag: (sorted original lines, elements in the same order)}."""
+        if self._lines is None:
+            self._lines = {}
+            # Document order is line order, so the lists are built sorted
+            for elem in self.root.iter(lxml.etree.Element):
+                # Elements inserted since parsing have no original line
+                if elem.sourceline:
+                    lines, elems = self._lines.setdefault(elem.tag, ([], []))
+                    lines.append(elem.sourceline)
+                    elems.append(elem)
+        return self._lines
+
+    def _is_attached(self, elem):
+        while elem is not None:
+            if elem is self.root:
+                return True
+            elem = elem.getparent()
+        return False
+
+    def _get_line(self, elem):
+        return elem.sourceline
+
+    def _get_attribute(self, elem, name):
+        attribute = self._clark(name, attribute=True)
+        return elem.get(attribute, "") if attribute else ""
+
+    def _ancestors(self, elem, stop):
+        while elem is not None:
+            yield elem
+            if elem is stop:
+                return
+            elem = elem.getparent()
+
+    def _get_text_index(self):
+        if self._text_index is None:
+            paragraph_tag = self._clark("w:p")
+            self._text_index = _TextIndex(
+                self.root.iter(paragraph_tag) if paragraph_tag else (),
+                _lxml_text_parts,
+            )
+        return self._text_index
+
+    def _get_element_text(self, elem):
+        """Extract the text content of an element, as XMLEditor._get_element_text()."""
+        return "".join(part for part, _ in _lxml_text_parts(elem))
+
+    def _get_namespaces(self):
+        """Return the prefix to namespace URI map of the document known so far."""
+        if self._namespaces is None:
+            # Office parts declare their namespaces on the root element
+            self._namespaces = dict(self.root.nsmap)
+        return self._namespaces
+
+    def _get_namespace(self, prefix):
+        """Return the URI of a prefix, scanning the whole tree if the root lacks it."""
+        namespaces = self._get_namespaces()
+        if prefix not in namespaces and not self._namespaces_complete:
+            for elem in self.root.iter(lxml.etree.Element):
+                for key, uri in elem.nsmap.items():
+                    namespaces.setdefault(key, uri)
+            self._namespaces_complete = True
+        return namespaces.get(prefix)
+
+    def _clark(self, name, attribute=False):
+        """
+        Convert a prefixed name ("w:p") to lxml's {namespace}name form.
+
+        Unprefixed element names are in the default namespace, unprefixed
+        attribute names in none.
+
+        Returns:
+            str or None: The name, or None if its prefix is not declared
+        """
+        prefix, _, local = name.rpartition(":")
+        if prefix == "xml":
+            return f"{{{_XML_NAMESPACE}}}{local}"
+        if not prefix and attribute:
+            return local
+        uri = self._get_namespace(prefix or None)
+        if uri is None:
+            return None if prefix else local
+        return f"{{{uri}}}{local}"
+
+    def _parse_fragment(self, xml_content):
+        """
+        Parse an XML fragment using the document's namespace declarations.
+
+        Returns:
+            tuple: (text before the first element or None, list of elements)
+
+        Raises:
+            AssertionError: If fragment contains no element nodes
+        """
+        ns_decl = " ".join(
+            f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+            for prefix, uri in self.root.nsmap.items()
+        )
+        wrapper = lxml.etree.fromstring(
+            f"<root {ns_decl}>{xml_content}</root>", _create_lxml_parser()
+        )
+        elements = list(wrapper)
+        assert any(isinstance(e.tag, str) for e in elements), (
+            "Fragment must contain at least one element"
+        )
+        for elem in wrapper.iter():
+            # Lines of the fragment are not lines of the file
+            elem.sourceline = 0
+        return wrapper.text, elements
+
+
+def _single_match(matches, tag, attrs, line_number, contains):
+    """
+    Return the only element of a get_node() query's matches.
+
+    Raises:
+        ValueError: If there is no match or more than one, describing the query
+    """
+    if not matches:
+        # Build descriptive error message
+        filters = []
+        if line_number is not None:
+            line_str = (
+                f"lines {line_number.start}-{line_number.stop - 1}"
+                if isinstance(line_number, range)
+                else f"line {line_number}"
+            )
+            filters.append(f"at {line_str}")
+        if attrs is not None:
+            filters.append(f"with attributes {attrs}")
+        if contains is not None:
+            filters.append(f"containing '{contains}'")
+
+        filter_desc = " ".join(filters) if filters else ""
+        base_msg = f"Node not found: <{tag}> {filter_desc}".strip()
+
+        # Add helpful hint based on filters used
+        if contains:
+            hint = "Text may be split across elements or use different wording."
+        elif line_number:
+            hint = "Line numbers may have changed if document was modified."
+        elif attrs:
+            hint = "Verify attribute values are correct."
+        else:
+            hint = "Try adding filters (attrs, line_number, or contains)."
+
+        raise ValueError(f"{base_msg}. {hint}")
+    if len(matches) > 1:
+        raise ValueError(
+            f"Multiple nodes found: <{tag}>. "
+            f"Add more filters (attrs, line_number, or contains) to narrow the search."
+        )
+    return matches[0]
+
+
+class _NodeIndex:
+    """
+    Indexes over the elements of a DOM for XMLEditor.get_node().
+
+    Elements are indexed by tag name, by the values of INDEXED_ATTRIBUTES, and
+    per tag by original line number in a sorted list searched by bisection.
+    Entries may go stale (removed elements, changed attribute values); callers
+    re-check every candidate against the query.
+    """
+
+    def __init__(self, dom):
+        # Dicts with None values serve as insertion-ordered sets
+        self.by_tag = {}
+        self.by_attr = {}
+        # tag -> (sorted line numbers, elements in the same order)
+        self.lines = {}
+        for elem in _iter_elements(dom.documentElement):
+            self.add(elem)
+            # Document order is line order, so the lists are built sorted
+            parse_pos = getattr(elem, "parse_position", None)
+            if parse_pos is not None:
+                lines, elems = self.lines.setdefault(elem.tagName, ([], []))
+                lines.append(parse_pos[0])
+                elems.append(elem)
+
+    def add(self, elem):
+        """Index one element by tag and identifying attributes."""
+        self.by_tag.setdefault(elem.tagName, {})[elem] = None
+        for attr_name in INDEXED_ATTRIBUTES:
+            value = elem.getAttribute(attr_name)
+            if value:
+                self.by_attr.setdefault((attr_name, value), {})[elem] = None
+
+    def add_subtree(self, node):
+        """Index a node and its descendant elements.
+
+        Nodes added after parsing have no original line and are not added to
+        the line index.
+        """
+        for elem in _iter_elements(node):
+            self.add(elem)
+
+    def remove_subtree(self, node):
+        """Drop a node and its descendant elements from the tag and attribute indexes."""
+        for elem in _iter_elements(node):
+            self.by_tag.get(elem.tagName, {}).pop(elem, None)
+            for attr_name in INDEXED_ATTRIBUTES:
+                value = elem.getAttribute(attr_name)
+                if value:
+                    self.by_attr.get((attr_name, value), {}).pop(elem, None)
+
+    def candidates(self, tag, attrs, line_number, text_matches=None):
+        """Return the indexed elements that may match a query."""
+        for attr_name in INDEXED_ATTRIBUTES:
+            # An empty value also matches elements without the attribute
+            if attrs and attrs.get(attr_name):
+                return list(self.by_attr.get((attr_name, attrs[attr_name]), ()))
+
+        if isinstance(line_number, int) or (
+            isinstance(line_number, range) and line_number.step == 1
+        ):
+            lines, elems = self.lines.get(tag, ((), ()))
+            if isinstance(line_number, range):
+                start, stop = line_number.start, line_number.stop
+            else:
+                start, stop = line_number, line_number + 1
+            return elems[bisect.bisect_left(lines, start) : bisect.bisect_left(lines, stop)]
+
+        if text_matches is not None:
+            return list(text_matches)
+        return list(self.by_tag.get(tag, ()))
+
+
+class _TextIndex:
+    """
+    Inverted n-gram index over the text of w:p elements.
+
+    Records each paragraph's text (as returned by XMLEditor._get_element_text)
+    with the offset at which each text element's content starts, and maps every
+    substring of _NGRAM_SIZE characters to the paragraphs containing it. A
+    search intersects the paragraph sets of the query's n-grams and only scans
+    the text of the paragraphs left. The editor keeps the index up to date as
+    paragraphs change.
+    """
+
+    def __init__(self, paragraphs, text_parts):
+        """
+        Args:
+            paragraphs: The w:p elements to index
+            text_parts: Function yielding (text, element holding it) for the
+                content text of a paragraph, in document order
+        """
+        self.text_parts = text_parts
+        # w:p -> (text, segment start offsets, segment elements)
+        self.paragraphs = {}
+        # n-gram -> paragraphs containing it (dict as ordered set)
+        self.postings = {}
+        for paragraph in paragraphs:
+            self.add(paragraph)
+
+    def add(self, paragraph):
+        """Index a paragraph, replacing its previous entry."""
+        self.remove(paragraph)
+        parts, starts, elements = [], [], []
+        offset = 0
+        for part, elem in self.text_parts(paragraph):
+            parts.append(part)
+            starts.append(offset)
+            elements.append(elem)
+            offset += len(part)
+        text = "".join(parts)
+        self.paragraphs[paragraph] = (text, starts, elements)
+        for gram in _ngrams(text):
+            self.postings.setdefault(gram, {})[paragraph] = None
+
+    def remove(self, paragraph):
+        entry = self.paragraphs.pop(paragraph, None)
+        if entry is None:
+            return
+        for gram in _ngrams(entry[0]):
+            postings = self.postings.get(gram)
+            if postings is not None:
+                postings.pop(paragraph, None)
+                if not postings:
+                    del self.postings[gram]
+
+    def search(self, text):
+        """Yield (paragraph, start offset) for every occurrence of text."""
+        if len(text) >= _NGRAM_SIZE:
+            postings = sorted(
+                (self.postings.get(gram, {}) for gram in set(_ngrams(text))), key=len
+            )
+            paragraphs = [
+                paragraph
+                for paragraph in postings[0]
+                if all(paragraph in other for other in postings[1:])
+            ]
+        else:
+            paragraphs = list(self.paragraphs)
+
+        for paragraph in paragraphs:
+            paragraph_text = self.paragraphs[paragraph][0]
+            start = paragraph_text.find(text)
+            while start != -1:
+                yield paragraph, start
+                start = paragraph_text.find(text, start + 1)
+
+    def elements_at(self, paragraph, start, end):
+        """Return the text elements holding paragraph text [start, end), in order."""
+        _, starts, elements = self.paragraphs[paragraph]
+        first = bisect.bisect_right(starts, start) - 1
+        last = max(bisect.bisect_left(starts, end) - 1, first)
+        result = []
+        for elem in elements[first : last + 1]:
+            # Consecutive text nodes may share an element
+            if not result or result[-1] is not elem:
+                result.append(elem)
+        return result
+
+
+def _lxml_text_parts(elem):
+    """
+    Yield (text, element holding it) for the content text within an lxml element.
+
+    Mirrors _iter_text_nodes(): whitespace-only text next to child elements is
+    XML formatting and skipped. Text after a child (its tail) is held by the
+    parent.
+    """
+    has_elements = any(isinstance(child.tag, str) for child in elem)
+    if elem.text and (not has_elements or elem.text.strip()):
+        yield elem.text, elem
+    for child in elem:
+        if isinstance(child.tag, str):
+            yield from _lxml_text_parts(child)
+        if child.tail and (not has_elements or child.tail.strip()):
+            yield child.tail, elem
+
+
+def _write_file(path, content):
+    """
+    Write content to a file by atomically replacing it.
+
+    Files of a working copy may be hard links to the files they were copied
+    from; replacing the file instead of writing into it leaves those intact.
+    Path-like objects that are not files on disk (such as the PartPath of an
+    in-memory part) are written with write_bytes().
+    """
+    if not isinstance(path, Path):
+        path.write_bytes(content)
+        return
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        if path.exists():
+            os.chmod(temp_path, path.stat().st_mode & 0o7777)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def _join_text(first, second):
+    """Concatenate two lxml text/tail values, either of which may be None."""
+    return (first or "") + (second or "") or None
+
+
+def _create_lxml_parser():
+    """Create an lxml parser without entity expansion, DTD loading or network access."""
+    return lxml.etree.XMLParser(
+        resolve_entities=False, no_network=True, load_dtd=False, huge_tree=False
+    )
+
+
+def _minidom_text_parts(paragraph):
+    """Yield (text, element holding it) for the content text within a DOM element."""
+    for node in _iter_text_nodes(paragraph):
+        yield node.data, node.parentNode
+
+
+def _ngrams(text):
+    return (text[i : i + _NGRAM_SIZE] for i in range(len(text) - _NGRAM_SIZE + 1))
+
+
+def _ancestors(node, stop=None):
+    """Yield a node and its ancestor elements, up to and including stop."""
+    while node is not None and node.nodeType == node.ELEMENT_NODE:
+        yield node
+        if node is stop:
+            return
+        node = node.parentNode
+
+
+def _iter_text_nodes(node):
+    """Yield the content text nodes within an element, in document order.
+
+    Whitespace-only text next to child elements is XML formatting and skipped.
+    """
+    stack = [iter(node.childNodes)]
+    formatting = [_has_child_elements(node)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            formatting.pop()
+        elif child.nodeType == child.TEXT_NODE:
+            if not formatting[-1] or child.data.strip():
+                yield child
+        elif child.nodeType == child.ELEMENT_NODE:
+            stack.append(iter(child.childNodes))
+            formatting.append(_has_child_elements(child))
+
+
+def _has_child_elements(node):
+    return any(child.nodeType == child.ELEMENT_NODE for child in node.childNodes)
+
+
+def _iter_elements(node):
+    """Yield a node (if it is an element) and its descendant elements in document order."""
+    if node is None:
+        return
+    if node.nodeType == node.ELEMENT_NODE:
+        yield node
+    stack = list(reversed(node.childNodes))
+    while stack:
+        child = stack.pop()
+        if child.nodeType == child.ELEMENT_NODE:
+            yield child
+            stack.extend(reversed(child.childNodes))
+
+
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark the lxml XML formatting of pack.py/unpack.py against minidom.
+
+Every XML part of the given Office files is pretty-printed (as unpack.py does)
+and the result condensed again (as pack.py does) with both implementations.
+The outputs must be byte-identical; the script exits with status 1 otherwise.
+
+Example usage:
+    python bench_formatting.py <office_file> [<office_file> ...] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+import zipfile
+
+from validation.formatting import (
+    condense_xml_bytes,
+    minidom_condense_xml_bytes,
+    minidom_pretty_xml_bytes,
+    pretty_xml_bytes,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare lxml and minidom XML formatting"
+    )
+    parser.add_argument("office_files", nargs="+", help="Office files to read parts from")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per part (best is kept)"
+    )
+    args = parser.parse_args()
+
+    parts = []
+    for office_file in args.office_files:
+        with zipfile.ZipFile(office_file) as zf:
+            for name in zf.namelist():
+                if name.endswith((".xml", ".rels")):
+                    parts.append((f"{office_file}:{name}", zf.read(name)))
+
+    totals = {"pretty": [0.0, 0.0], "condense": [0.0, 0.0]}
+    mismatches = []
+    for label, content in parts:
+        pretty, timings = _compare(
+            minidom_pretty_xml_bytes, pretty_xml_bytes, content, args.repeat
+        )
+        if pretty is None:
+            mismatches.append(f"{label} (pretty-print)")
+            continue
+        _add(totals["pretty"], timings)
+
+        condensed, timings = _compare(
+            minidom_condense_xml_bytes, condense_xml_bytes, pretty, args.repeat
+        )
+        if condensed is None:
+            mismatches.append(f"{label} (condense)")
+            continue
+        _add(totals["condense"], timings)
+
+    size = sum(len(content) for _, content in parts)
+    print(f"{len(parts)} parts, {size / 1024:.1f} KiB")
+    for operation, (minidom_time, lxml_time) in totals.items():
+        speedup = minidom_time / lxml_time if lxml_time else float("inf")
+        print(
+            f"{operation:>8}: minidom {minidom_time * 1000:8.1f}ms  "
+            f"lxml {lxml_time * 1000:8.1f}ms  ({speedup:.1f}x)"
+        )
+
+    if mismatches:
+        print(f"FAILED - {len(mismatches)} outputs differ from minidom:")
+        for mismatch in mismatches:
+            print(f"  {mismatch}")
+        sys.exit(1)
+    print("PASSED - All outputs are byte-identical")
+
+
+def _compare(reference, candidate, content, repeat):
+    """Time two formatters on the same content.
+
+    Returns:
+        tuple: (output, (reference_time, candidate_time)), where output is None
+            if the formatters disagree
+    """
+    expected, reference_time = _best_time(reference, content, repeat)
+    actual, candidate_time = _best_time(candidate, content, repeat)
+    if actual != expected:
+        return None, None
+    return actual, (reference_time, candidate_time)
+
+
+def _best_time(formatter, content, repeat):
+    """Return a formatter's output and its best wall time over several runs."""
+    best = None
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        output = formatter(content)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return output, best
+
+
+def _add(total, timings):
+    total[0] += timings[0]
+    total[1] += timings[1]
+
+
+if __name__ == "__main__":
+    main()
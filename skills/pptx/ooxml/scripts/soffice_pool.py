@@ -0,0 +1,687 @@
+#!/usr/bin/env python3
+"""
+Pool of persistent headless LibreOffice workers.
+
+Starting soffice costs several seconds, and concurrent `soffice --headless` runs
+collide on the shared user profile. Each worker of this pool is a long-lived
+`soffice --accept` listener with its own user profile (-env:UserInstallation),
+driven through the UNO bridge. Workers outlive the script that started them, so
+later runs reuse them without paying for the startup again.
+
+Clients take a free worker under a file lock; at most `queue_size` clients wait
+for one, and further clients are turned away with PoolUnavailable. A worker that
+does not answer its health check is restarted, and one that hangs during a
+conversion is killed and restarted by the next client.
+
+The pool is used by pack.py (validation), pptx thumbnail.py and xlsx recalc.py
+when available(): soffice is on the PATH and the uno module (python3-uno) can be
+imported. Otherwise they run soffice once per conversion. Either way, outputs
+are kept in a content-addressed ConversionCache and reused for identical input.
+
+Environment:
+    OOXML_SOFFICE_POOL: "0" disables the pool
+    OOXML_SOFFICE_WORKERS: Number of workers (default: 2)
+    OOXML_SOFFICE_DIR: State directory holding the worker profiles
+    OOXML_CONVERSION_CACHE: Conversion cache directory
+        (default: ~/.cache/ooxml-conversions)
+    OOXML_CONVERSION_CACHE_SIZE: Cache size cap in bytes (default: 512 MiB)
+
+Example usage:
+    python soffice_pool.py start    # Start the workers ahead of time
+    python soffice_pool.py status
+    python soffice_pool.py stop
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: the pool is not available
+    fcntl = None
+
+POOL_ENV = "OOXML_SOFFICE_POOL"
+WORKERS_ENV = "OOXML_SOFFICE_WORKERS"
+STATE_DIR_ENV = "OOXML_SOFFICE_DIR"
+CACHE_DIR_ENV = "OOXML_CONVERSION_CACHE"
+CACHE_SIZE_ENV = "OOXML_CONVERSION_CACHE_SIZE"
+
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 8
+DEFAULT_CACHE_SIZE = 512 * 1024 * 1024
+
+# Seconds to wait for a new worker to accept connections, for a worker to answer
+# its health check, and for a queued client to get a worker
+START_TIMEOUT = 60
+HEALTH_TIMEOUT = 5
+QUEUE_TIMEOUT = 120
+
+# Export filters for conversions given by extension only, by document service
+_PDF_FILTERS = {
+    "com.sun.star.presentation.PresentationDocument": "impress_pdf_Export",
+    "com.sun.star.sheet.SpreadsheetDocument": "calc_pdf_Export",
+    "com.sun.star.drawing.DrawingDocument": "draw_pdf_Export",
+    "com.sun.star.text.TextDocument": "writer_pdf_Export",
+}
+
+
+class PoolUnavailable(RuntimeError):
+    """No worker could be used; callers fall back to a one-off soffice run."""
+
+
+class ConversionError(RuntimeError):
+    """LibreOffice failed to load, convert or store a document."""
+
+
+def available():
+    """Return True if conversions can be run on the worker pool."""
+    if os.environ.get(POOL_ENV) == "0" or fcntl is None:
+        return False
+    return (
+        shutil.which("soffice") is not None
+        and importlib.util.find_spec("uno") is not None
+    )
+
+
+def get_state_dir():
+    """Return the directory holding the worker profiles, pids and locks."""
+    override = os.environ.get(STATE_DIR_ENV)
+    if override:
+        return Path(override)
+    return Path(tempfile.gettempdir()) / f"ooxml-soffice-{os.getuid()}"
+
+
+def get_cache_dir():
+    """Return the directory of the conversion cache."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "ooxml-conversions"
+
+
+_default_pool = None
+
+
+def get_pool():
+    """Return the pool shared by the conversions of this process."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = SofficePool()
+    return _default_pool
+
+
+def convert(input_file, output_dir, convert_to, timeout=60, use_cache=True):
+    """Convert a document with LibreOffice, like `soffice --convert-to`.
+
+    The output is taken from the conversion cache when the same input was
+    converted to the same target before. Otherwise the document is converted on
+    the worker pool if available, or by a one-off soffice process.
+
+    Args:
+        input_file: Document to convert
+        output_dir: Directory the converted file is written to
+        convert_to: Target as given to --convert-to (e.g. "pdf", "html:HTML")
+        timeout: Seconds allowed for the conversion
+        use_cache: If False, neither read nor fill the conversion cache
+
+    Returns:
+        Path: The converted file, <output_dir>/<input stem>.<ext>
+
+    Raises:
+        FileNotFoundError: soffice is not installed
+        ConversionError: LibreOffice failed to convert the document
+        TimeoutError: The conversion did not finish within timeout seconds
+    """
+    extension = convert_to.partition(":")[0]
+    output_file = Path(output_dir) / f"{Path(input_file).stem}.{extension}"
+    cache = ConversionCache() if use_cache else None
+    key = cache.key(input_file, convert_to) if cache else None
+    if cache and cache.fetch(key, output_file):
+        return output_file
+
+    if available():
+        try:
+            get_pool().convert(input_file, output_dir, convert_to, timeout)
+        except PoolUnavailable:
+            _convert_once(input_file, output_dir, convert_to, timeout)
+    else:
+        _convert_once(input_file, output_dir, convert_to, timeout)
+
+    if cache:
+        cache.store(key, output_file)
+    return output_file
+
+
+def recalculate(input_file, timeout=60):
+    """Recalculate a spreadsheet on the shared pool. See SofficePool.recalculate()."""
+    return get_pool().recalculate(input_file, timeout)
+
+
+class ConversionCache:
+    """Content-addressed cache of LibreOffice outputs.
+
+    Entries are keyed by the SHA-256 of the input bytes and the conversion
+    target, so converting an unchanged file again (e.g. rendering a deck before
+    and after edits elsewhere, or validating an identical package) copies the
+    previous output instead of running LibreOffice. The least recently used
+    entries are evicted once the cache grows past max_size bytes.
+
+    Attributes:
+        directory: Directory holding the cached outputs
+        max_size: Size cap in bytes
+    """
+
+    def __init__(self, directory=None, max_size=None):
+        self.directory = Path(directory) if directory else get_cache_dir()
+        if max_size is None:
+            max_size = int(os.environ.get(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE))
+        self.max_size = max_size
+
+    def key(self, input_file, target):
+        """Return the cache key for converting input_file to target.
+
+        Args:
+            input_file: Document to convert
+            target: Conversion target (e.g. "pdf", "html:HTML", "recalc")
+        """
+        digest = hashlib.sha256(f"{target}\0".encode("utf-8"))
+        with open(input_file, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def fetch(self, key, output_file):
+        """Copy a cached output to output_file.
+
+        Returns:
+            bool: True on a hit, False if the entry is missing or unreadable
+        """
+        entry = self.directory / key
+        try:
+            shutil.copyfile(entry, output_file)
+            # Mark as recently used
+            os.utime(entry)
+        except OSError:
+            return False
+        return True
+
+    def store(self, key, output_file):
+        """Add an output to the cache and evict old entries beyond the size cap.
+
+        Failures are ignored (the cache is optional).
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as f, open(output_file, "rb") as source:
+                shutil.copyfileobj(source, f)
+            os.replace(temp_path, self.directory / key)
+        except OSError:
+            Path(temp_path).unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self):
+        """Remove the least recently used entries until the cache fits max_size."""
+        entries = []
+        for entry in self.directory.iterdir():
+            if entry.suffix == ".tmp":
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+class SofficePool:
+    """Client for a pool of persistent soffice workers.
+
+    The pool itself lives in the state directory and is shared by every process
+    using the same directory; this object only takes workers from it.
+
+    Attributes:
+        workers: Number of worker processes
+        queue_size: Number of clients allowed to wait for a worker
+        state_dir: Directory holding the worker profiles, pids and locks
+    """
+
+    def __init__(self, workers=None, queue_size=DEFAULT_QUEUE_SIZE, state_dir=None):
+        self.workers = workers or int(os.environ.get(WORKERS_ENV, DEFAULT_WORKERS))
+        self.queue_size = queue_size
+        self.state_dir = Path(state_dir) if state_dir else get_state_dir()
+
+    def convert(self, input_file, output_dir, convert_to, timeout=60):
+        """Convert a document, like `soffice --convert-to <convert_to> --outdir`.
+
+        Args:
+            input_file: Document to convert
+            output_dir: Directory the converted file is written to
+            convert_to: Target as given to --convert-to: "<ext>:<filter>" (e.g.
+                "html:HTML") or an extension with a known filter ("pdf")
+            timeout: Seconds allowed for the conversion
+
+        Returns:
+            Path: The converted file, <output_dir>/<input stem>.<ext>
+
+        Raises:
+            PoolUnavailable: No worker could be used
+            ConversionError: LibreOffice failed to convert the document
+            TimeoutError: The conversion hung; the worker is restarted
+        """
+        extension, _, filter_name = convert_to.partition(":")
+        output_file = Path(output_dir) / f"{Path(input_file).stem}.{extension}"
+        input_url = Path(input_file).resolve().as_uri()
+        output_url = output_file.resolve().as_uri()
+
+        def operation(desktop):
+            document = _load(desktop, input_url)
+            try:
+                name = filter_name or _default_filter(document, extension)
+                document.storeToURL(output_url, _properties(FilterName=name))
+            finally:
+                document.close(True)
+
+        self._run(operation, timeout)
+        if not output_file.exists():
+            raise ConversionError(f"No output written for {input_file}")
+        return output_file
+
+    def recalculate(self, input_file, timeout=60):
+        """Recalculate all formulas of a spreadsheet and save it in place.
+
+        Raises:
+            PoolUnavailable: No worker could be used
+            ConversionError: LibreOffice failed to load or store the document
+            TimeoutError: The recalculation hung; the worker is restarted
+        """
+        input_url = Path(input_file).resolve().as_uri()
+
+        def operation(desktop):
+            document = _load(desktop, input_url)
+            try:
+                document.calculateAll()
+                document.store()
+            finally:
+                document.close(True)
+
+        self._run(operation, timeout)
+
+    def start(self):
+        """Start every worker that is not running yet."""
+        for index in range(self.workers):
+            with self._worker_lock(index, blocking=True):
+                worker = _Worker(self.state_dir, index)
+                worker.connect()
+
+    def status(self):
+        """Return a list of (index, pid or None, busy) for the workers."""
+        result = []
+        for index in range(self.workers):
+            worker = _Worker(self.state_dir, index)
+            with self._worker_lock(index, blocking=False) as locked:
+                result.append((index, worker.running_pid(), not locked))
+        return result
+
+    def stop(self):
+        """Stop all workers, waiting for running conversions to finish."""
+        for index in range(self.workers):
+            with self._worker_lock(index, blocking=True):
+                _Worker(self.state_dir, index).kill()
+
+    def _run(self, operation, timeout):
+        """Run operation(desktop) on a free worker within timeout seconds."""
+        with self._queue_slot(), self._acquire_worker() as worker:
+            desktop = worker.connect()
+            outcome = _call_with_timeout(operation, (desktop,), timeout)
+            if outcome is None:
+                # Hung; kill it so the next client starts a fresh one
+                worker.kill()
+                raise TimeoutError(f"soffice did not finish within {timeout}s")
+
+            error = outcome[1]
+            if error is not None:
+                if worker.running_pid() is None:
+                    worker.kill()
+                raise ConversionError(_uno_message(error)) from error
+
+    def _queue_slot(self):
+        """Take one of the queue_size slots for clients waiting for a worker."""
+        for slot in range(self.workers + self.queue_size):
+            lock = _FileLock(self.state_dir / f"slot-{slot}.lock")
+            if lock.acquire(blocking=False):
+                return lock
+        raise PoolUnavailable("soffice pool queue is full")
+
+    def _acquire_worker(self):
+        """Wait for a free worker and lock it."""
+        deadline = time.monotonic() + QUEUE_TIMEOUT
+        while True:
+            for index in range(self.workers):
+                lock = _FileLock(self._lock_path(index))
+                if lock.acquire(blocking=False):
+                    return _LockedWorker(lock, _Worker(self.state_dir, index))
+            if time.monotonic() > deadline:
+                raise PoolUnavailable("No soffice worker became free")
+            time.sleep(0.05)
+
+    def _worker_lock(self, index, blocking):
+        return _FileLock(self._lock_path(index), blocking)
+
+    def _lock_path(self, index):
+        return self.state_dir / f"worker-{index}.lock"
+
+
+class _Worker:
+    """One soffice listener, its profile and pid file.
+
+    The pid file holds the worker's pid and start time. A pid file left by a
+    crashed worker or an earlier boot may name a pid since reused by another
+    process; the start time tells them apart, so only the worker is signalled.
+    """
+
+    def __init__(self, state_dir, index):
+        self.directory = Path(state_dir) / f"worker-{index}"
+        self.pid_file = self.directory / "pid"
+        # Pipe names are global; derive them from the state directory
+        digest = hashlib.sha256(str(self.directory.resolve()).encode()).hexdigest()
+        self.pipe_name = f"ooxml-soffice-{digest[:16]}"
+
+    def running_pid(self):
+        """Return the pid of the worker process, or None if it is not running.
+
+        A pid file that does not name the worker (its process exited, or the
+        pid was reused) is removed.
+        """
+        try:
+            pid_text, _, started = self.pid_file.read_text().partition(" ")
+            pid = int(pid_text)
+        except (OSError, ValueError):
+            return None
+        start_time = _process_start_time(pid)
+        if start_time is None or start_time != started.strip():
+            self.pid_file.unlink(missing_ok=True)
+            return None
+        return pid
+
+    def connect(self):
+        """Return the worker's Desktop, starting or restarting the worker as needed."""
+        if self.running_pid() is not None:
+            outcome = _call_with_timeout(self._resolve, (), HEALTH_TIMEOUT)
+            if outcome is not None and outcome[1] is None:
+                return outcome[0]
+            # Not answering: replace it
+            self.kill()
+
+        self._start()
+        deadline = time.monotonic() + START_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.running_pid() is None:
+                raise PoolUnavailable("soffice worker exited during startup")
+            outcome = _call_with_timeout(self._resolve, (), HEALTH_TIMEOUT)
+            if outcome is not None and outcome[1] is None:
+                return outcome[0]
+            time.sleep(0.25)
+        self.kill()
+        raise PoolUnavailable("soffice worker did not start")
+
+    def kill(self):
+        """Kill the worker and everything it started."""
+        pid = self.running_pid()
+        if pid is not None:
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except OSError:
+                pass
+        self.pid_file.unlink(missing_ok=True)
+
+    def _start(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profile = self.directory / "profile"
+        try:
+            process = subprocess.Popen(
+                [
+                    "soffice",
+                    "--headless",
+                    "--invisible",
+                    "--nologo",
+                    "--nodefault",
+                    "--norestore",
+                    "--nolockcheck",
+                    f"-env:UserInstallation={profile.resolve().as_uri()}",
+                    f"--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                # Own process group, so it survives this script and can be killed
+                # together with the soffice.bin it spawns
+                start_new_session=True,
+            )
+        except OSError as e:
+            raise PoolUnavailable(f"Could not start soffice: {e}") from e
+        self.pid_file.write_text(f"{process.pid} {_process_start_time(process.pid)}")
+
+    def _resolve(self):
+        import uno
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        context = resolver.resolve(
+            f"uno:pipe,name={self.pipe_name};urp;StarOffice.ComponentContext"
+        )
+        return context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+
+def _process_start_time(pid):
+    """Return when a process started, as an opaque string, or None if it is not running.
+
+    Uses the start time in /proc where there is one and asks ps otherwise.
+    """
+    if os.path.isdir("/proc/self"):
+        try:
+            stat = Path(f"/proc/{pid}/stat").read_text()
+        except OSError:
+            return None
+        # Field 22, counted after the command name, which may contain spaces
+        return stat.rpartition(")")[2].split()[19]
+    try:
+        result = subprocess.run(
+            ["ps", "-o", "lstart=", "-p", str(pid)],
+            capture_output=True,
+            text=True,
+            timeout=HEALTH_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+class _LockedWorker:
+    """Context manager releasing a worker's lock on exit."""
+
+    def __init__(self, lock, worker):
+        self.lock = lock
+        self.worker = worker
+
+    def __enter__(self):
+        return self.worker
+
+    def __exit__(self, *exc_info):
+        self.lock.release()
+
+
+class _FileLock:
+    """Exclusive flock on a file, shared between processes.
+
+    As a context manager it acquires the lock on entry (if not already held) and
+    yields whether it is held.
+    """
+
+    def __init__(self, path, blocking=True):
+        self.path = Path(path)
+        self.blocking = blocking
+        self._fd = None
+
+    def acquire(self, blocking=True):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        if self._fd is None:
+            self.acquire(self.blocking)
+        return self._fd is not None
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+def _call_with_timeout(function, args, timeout):
+    """Call function in a daemon thread.
+
+    Returns:
+        tuple or None: (result, exception) once it returns or raises, or None if
+            it is still running after timeout seconds
+    """
+    outcome = []
+
+    def target():
+        try:
+            outcome.append((function(*args), None))
+        except Exception as e:
+            outcome.append((None, e))
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return outcome[0] if outcome else None
+
+
+def _convert_once(input_file, output_dir, convert_to, timeout):
+    """Convert a document with a one-off `soffice --headless --convert-to` run."""
+    try:
+        result = subprocess.run(
+            [
+                "soffice",
+                "--headless",
+                "--convert-to",
+                convert_to,
+                "--outdir",
+                str(output_dir),
+                str(input_file),
+            ],
+            capture_output=True,
+            timeout=timeout,
+            text=True,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise TimeoutError(f"soffice did not finish within {timeout}s") from e
+
+    extension = convert_to.partition(":")[0]
+    if not (Path(output_dir) / f"{Path(input_file).stem}.{extension}").exists():
+        raise ConversionError(
+            result.stderr.strip() or f"soffice did not convert {input_file}"
+        )
+
+
+def _load(desktop, url):
+    """Load a document hidden and without running its macros."""
+    document = desktop.loadComponentFromURL(
+        url, "_blank", 0, _properties(Hidden=True, MacroExecutionMode=0)
+    )
+    if document is None:
+        raise ConversionError(f"LibreOffice could not load {url}")
+    return document
+
+
+def _default_filter(document, extension):
+    if extension == "pdf":
+        for service, filter_name in _PDF_FILTERS.items():
+            if document.supportsService(service):
+                return filter_name
+    raise ConversionError(f"No export filter known for .{extension}; use ext:Filter")
+
+
+def _properties(**values):
+    import uno
+
+    properties = []
+    for name, value in values.items():
+        prop = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
+
+
+def _uno_message(error):
+    """Return the message of a UNO exception (or any other exception)."""
+    return getattr(error, "Message", None) or str(error) or type(error).__name__
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the soffice worker pool")
+    parser.add_argument("command", choices=["start", "status", "stop"])
+    parser.add_argument(
+        "-w", "--workers", type=int, help=f"Number of workers (default: {DEFAULT_WORKERS})"
+    )
+    args = parser.parse_args()
+
+    if not available():
+        print("Error: soffice pool is not available (needs soffice and python3-uno)")
+        sys.exit(1)
+
+    pool = SofficePool(workers=args.workers)
+    match args.command:
+        case "start":
+            pool.start()
+            print(f"Started {pool.workers} soffice worker(s) in {pool.state_dir}")
+        case "status":
+            for index, pid, busy in pool.status():
+                state = "stopped" if pid is None else f"pid {pid}"
+                print(f"worker-{index}: {state}{' (busy)' if busy else ''}")
+        case "stop":
+            pool.stop()
+            print(f"Stopped {pool.workers} soffice worker(s)")
+
+
+if __name__ == "__main__":
+    main()
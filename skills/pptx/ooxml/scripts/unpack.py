@@ -1,29 +1,142 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Example usage:
+    python unpack.py <office_file> <output_dir> [--parts PARTS] [--lazy]
+"""
+
+import argparse
+import fnmatch
 import random
 import sys
-import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+try:
+    from .validation.formatting import format_contents, format_files, pretty_xml_bytes
+    from .validation.manifest import write_manifest
+    from .validation.parts import PackageParts, open_archive
+except ImportError:  # Run as a script from this directory
+    from validation.formatting import format_contents, format_files, pretty_xml_bytes
+    from validation.manifest import write_manifest
+    from validation.parts import PackageParts, open_archive
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unpack an Office file")
+    parser.add_argument("office_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "--parts",
+        help="Comma-separated part names or glob patterns to pretty-print "
+        "(e.g. 'word/document.xml,ppt/slides/slide3.xml'); other parts are "
+        "extracted verbatim",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Leave the parts not selected by --parts in the Office file; they "
+        "are read from it on demand and packed from it unchanged",
+    )
+    args = parser.parse_args()
+
+    if args.lazy and not args.parts:
+        parser.error("--lazy requires --parts")
+    patterns = args.parts.split(",") if args.parts else None
+
+    unpack_document(args.office_file, args.output_dir, patterns, lazy=args.lazy)
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.office_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(input_file, output_dir, patterns=None, lazy=False):
+    """Extract an Office file and pretty-print its XML parts.
+
+    Args:
+        input_file: Path to the Office file
+        output_dir: Directory to unpack into
+        patterns: Part names or glob patterns of the parts to pretty-print
+            (default: every XML and .rels part); other parts are extracted
+            verbatim
+        lazy: If True, parts not matched by patterns stay in the Office file
+            instead of being extracted
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    with zipfile.ZipFile(input_file) as zf:
+        names = [info.filename for info in zf.infolist() if not info.is_dir()]
+        matched = _match_parts(names, patterns)
+        selected = [name for name in matched if name.endswith((".xml", ".rels"))]
+
+        if lazy:
+            zf.extractall(output_path, matched)
+            lazy_parts = sorted(set(names) - set(matched))
+        else:
+            zf.extractall(output_path)
+            lazy_parts = []
+
+    # Pretty print the selected XML files (in worker processes for large packages)
+    format_files([output_path / name for name in selected], pretty_xml_bytes)
+
+    # Record per-part hashes so validation can skip parts that stay unchanged
+    write_manifest(output_path, input_file, set(selected), lazy_parts)
+
+
+def unpack_bytes(source, patterns=None, jobs=None):
+    """Unpack an Office file held in memory into an in-memory part map.
+
+    The in-memory counterpart of unpack_document; nothing is written to disk.
+    The result can be edited with Document/XMLEditor (through its part paths),
+    validated, and packed back with pack.pack_bytes().
+
+    Args:
+        source: The Office file as bytes, bytearray, memoryview, mmap or a
+            seekable binary file object (e.g. io.BytesIO). It is read in place
+            and kept as the parts' source, so it must stay open until packing.
+        patterns: Part names or glob patterns of the parts to pretty-print
+            (default: every XML and .rels part); other parts are kept verbatim
+        jobs: Worker processes for pretty-printing large packages
+            (default: one per CPU)
+
+    Returns:
+        PackageParts: Map of part name to contents, in archive order
+    """
+    with open_archive(source) as zf:
+        parts = {
+            info.filename: zf.read(info)
+            for info in zf.infolist()
+            if not info.is_dir()
+        }
+
+    selected = [
+        name
+        for name in _match_parts(list(parts), patterns)
+        if name.endswith((".xml", ".rels"))
+    ]
+    formatted = format_contents(
+        [parts[name] for name in selected], pretty_xml_bytes, jobs
+    )
+    parts.update(zip(selected, formatted))
+    return PackageParts(parts, source=source, formatted=selected)
+
+
+def _match_parts(names, patterns):
+    """Return the part names matching any pattern (all names if patterns is None)."""
+    if patterns is None:
+        return names
+    for pattern in patterns:
+        if not any(fnmatch.fnmatchcase(name, pattern) for name in names):
+            print(f"Warning: no part matches {pattern}", file=sys.stderr)
+    return [
+        name
+        for name in names
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    ]
+
+
+if __name__ == "__main__":
+    main()
@@ -3,21 +3,32 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir_or_file> --original <original_file> [--jobs N] [--no-incremental]
+                        [--report text|json] [--tier fast|full] [--budget SECONDS]
 """
 
 import argparse
+import contextlib
+import io
+import json
 import sys
+import zipfile
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
+from validation.report import run_check
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        help="Path to unpacked Office document directory or packed Office file",
     )
     parser.add_argument(
         "--original",
@@ -30,13 +41,46 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for XSD validation (default: 1; 0 uses all CPUs)",
+    )
+    parser.add_argument(
+        "--no-incremental",
+        action="store_true",
+        help="Re-run every check instead of reusing results for unchanged parts",
+    )
+    parser.add_argument(
+        "--report",
+        choices=["text", "json"],
+        default="text",
+        help="Output format: text (default) or a JSON report with per-check timing",
+    )
+    parser.add_argument(
+        "--tier",
+        choices=["fast", "full"],
+        default="full",
+        help="fast: only well-formedness, ID, relationship and content-type checks, "
+        "stopping at the first failure; full: all checks (default)",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="Wall-clock budget in seconds per validator; checks left when it is "
+        "spent are skipped and validation fails",
+    )
     args = parser.parse_args()
 
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
     file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
+    assert unpacked_dir.is_dir() or zipfile.is_zipfile(unpacked_dir), (
+        f"Error: {unpacked_dir} is not a directory or Office file"
+    )
     assert original_file.is_file(), f"Error: {original_file} is not a file"
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
@@ -46,6 +90,9 @@ def main():
     match file_extension:
         case ".docx":
             validators = [DOCXSchemaValidator, RedliningValidator]
+            if args.tier == "fast":
+                # Tracked-change comparison is a full-tier check
+                validators = [DOCXSchemaValidator]
         case ".pptx":
             validators = [PPTXSchemaValidator]
         case _:
@@ -54,12 +101,50 @@ def main():
 
     # Run validators
     success = True
+    reports = []
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
+        if issubclass(V, BaseSchemaValidator):
+            validator = V(
+                unpacked_dir,
+                original_file,
+                verbose=args.verbose,
+                jobs=args.jobs,
+                incremental=not args.no_incremental,
+            )
+        else:
+            validator = V(unpacked_dir, original_file, verbose=args.verbose)
+
+        # The JSON report replaces the human-readable output
+        output = io.StringIO() if args.report == "json" else sys.stdout
+        with contextlib.redirect_stdout(output):
+            if isinstance(validator, BaseSchemaValidator):
+                valid = validator.validate(tier=args.tier, budget=args.budget)
+                reports.append(validator.report())
+            else:
+                valid, check = run_check(
+                    "redlining", validator.validate, validator.results
+                )
+                reports.append(
+                    {
+                        "validator": V.__name__,
+                        "valid": valid,
+                        "wall_time": check["wall_time"],
+                        "cpu_time": check["cpu_time"],
+                        "checks": [check],
+                    }
+                )
+        if not valid:
             success = False
 
-    if success:
+    if args.report == "json":
+        report = {
+            "path": str(unpacked_dir),
+            "original": str(original_file),
+            "valid": success,
+            "validators": reports,
+        }
+        print(json.dumps(report, indent=2))
+    elif success:
         print("All validations PASSED!")
 
     sys.exit(0 if success else 1)
@@ -4,12 +4,22 @@ Validation modules for Word document processing.
 
 from .base import BaseSchemaValidator
 from .docx import DOCXSchemaValidator
+from .manifest import PartManifest, write_manifest
+from .package import OOXMLPackage
+from .parts import PackageParts
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .schemas import SchemaRegistry, schema_registry
 
 __all__ = [
     "BaseSchemaValidator",
     "DOCXSchemaValidator",
+    "OOXMLPackage",
+    "PackageParts",
+    "PartManifest",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "SchemaRegistry",
+    "schema_registry",
+    "write_manifest",
 ]
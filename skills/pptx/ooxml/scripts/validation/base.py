@@ -2,11 +2,22 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+from .cache import hash_directory, hash_file, read_cache_entry, write_cache_entry
+from .manifest import PartManifest
+from .package import OOXMLPackage
+from .parts import is_in_memory
+from .report import CheckResults, run_check
+from .schemas import schema_registry
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -81,6 +92,18 @@ class BaseSchemaValidator:
         "http://schemas.openxmlformats.org/package/2006/content-types"
     )
 
+    # Bump when the format or semantics of the cached original error index change
+    BASELINE_INDEX_VERSION = 1
+
+    # Cheap structural checks run by the "fast" tier (no XSD or tracked-change checks)
+    FAST_CHECKS = (
+        "validate_xml",
+        "validate_unique_ids",
+        "validate_file_references",
+        "validate_all_relationship_ids",
+        "validate_content_types",
+    )
+
     # Folders where we should clean ignorable namespaces
     MAIN_CONTENT_FOLDERS = {"word", "ppt", "xl"}
 
@@ -103,275 +126,462 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir).resolve()
-        self.original_file = Path(original_file)
+    def __init__(
+        self, unpacked_dir, original_file, verbose=False, jobs=1, incremental=True
+    ):
+        """
+        Args:
+            unpacked_dir: Path to unpacked Office document directory, or to a
+                packed Office file to validate in place, or a package held in
+                memory (PackageParts, bytes-like or file object)
+            original_file: Path to original file (.docx/.pptx/.xlsx), or the
+                original file held in memory (bytes-like or file object)
+            verbose: Enable verbose output
+            jobs: Number of worker processes for XSD validation
+                (default: 1, serial; 0 uses all CPUs)
+            incremental: Reuse per-part results cached in the package manifest
+                for parts that have not changed (default: True)
+        """
+        # Parse-once package model shared by all checks
+        self.package = OOXMLPackage(unpacked_dir)
+        self.xml_files = self.package.xml_files
+        self.unpacked_dir = self.package.root_dir
+        self.original_file = (
+            original_file if is_in_memory(original_file) else Path(original_file)
+        )
         self.verbose = verbose
+        self.jobs = jobs or os.cpu_count() or 1
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
-        # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
-        self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
-        ]
+        # XSD errors of the original document, built on first use
+        self._original_error_index = None
+
+        # Part-hash manifest written by unpack.py, if any
+        self.manifest = None
+        if incremental and not self.package.in_memory:
+            self.manifest = PartManifest.load(self.unpacked_dir)
+        self._part_digests = {}  # Path -> SHA-256 of the current part contents
+
+        # Per-run state of validate(), see report()
+        self._start_checks("full", None)
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
-    def validate(self):
-        """Run all validation checks and return True if all pass."""
+    def validate(self, tier="full", budget=None):
+        """Run all validation checks and return True if all pass.
+
+        Args:
+            tier: "full" runs every check; "fast" runs only FAST_CHECKS and stops
+                at the first failure
+            budget: Wall-clock budget in seconds (default: none). Checks that
+                would start after it is spent are skipped and validation fails.
+        """
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def report(self):
+        """Return the structured results of the last validate() run.
+
+        Returns:
+            dict: JSON-serialisable report with the validator name, overall
+                "valid" flag, tier and budget, skipped checks, number of parts,
+                total wall/CPU time, parse and
+                schema-compile counters, and one entry per check with its status,
+                errors, failing parts, number of parts examined, wall/CPU time
+                and the parses and schema compilations it caused (in this
+                process)
+        """
+        return {
+            "validator": type(self).__name__,
+            "valid": all(c["status"] == "passed" for c in self.check_results)
+            and not self.budget_exhausted,
+            "tier": self.tier,
+            "budget": self.budget,
+            "budget_exhausted": self.budget_exhausted,
+            "skipped": self.skipped_checks,
+            "parts": len(self.xml_files),
+            "wall_time": round(sum(c["wall_time"] for c in self.check_results), 6),
+            "cpu_time": round(sum(c["cpu_time"] for c in self.check_results), 6),
+            "counters": {
+                "parses": self.package.parse_count,
+                "schemas": schema_registry.stats(),
+            },
+            "checks": self.check_results,
+        }
+
+    def _start_checks(self, tier, budget):
+        """Reset the per-run state used by _run_check and report()."""
+        if tier not in ("fast", "full"):
+            raise ValueError(f"Unknown validation tier: {tier}")
+        self.tier = tier
+        self.budget = budget
+        self.budget_exhausted = False
+        self.check_results = []
+        self.skipped_checks = []
+        # Findings of the running check, see _examine and _print_errors
+        self._results = CheckResults()
+        self._checks_started = time.perf_counter()
+
+    def _finish_checks(self, all_valid):
+        """Save cached part results and return the overall result of a run."""
+        self.save_part_results()
+        if self.budget_exhausted:
+            print(
+                f"FAILED - Time budget of {self.budget}s exhausted; skipped: "
+                + ", ".join(self.skipped_checks)
+            )
+            return False
+        return all_valid
+
+    def _run_check(self, check):
+        """Run one check method, recording its timing and results for report().
+
+        Returns True without running the check if the tier excludes it. In the
+        fast tier, checks after a failure are skipped; once the time budget is
+        spent, all remaining checks are skipped.
+        """
+        name = check.__name__.removeprefix("validate_")
+        if self.tier == "fast":
+            if check.__name__ not in self.FAST_CHECKS:
+                return True
+            if any(c["status"] == "failed" for c in self.check_results):
+                self.skipped_checks.append(name)
+                return True
+        if self.budget is not None and (
+            self.budget_exhausted
+            or time.perf_counter() - self._checks_started > self.budget
+        ):
+            self.budget_exhausted = True
+            self.skipped_checks.append(name)
+            return True
+
+        parses = self.package.parse_count
+        compiles = schema_registry.misses
+
+        self._results = CheckResults()
+        passed, result = run_check(name, check, self._results)
+
+        # Parts named in the error lines, for targeted re-checks
+        part_names = {
+            self.package.relative_path(f).as_posix() for f in self.package.all_files
+        }
+        result["failing_parts"] = sorted(
+            {
+                token
+                for error in result["errors"]
+                for token in error.replace(":", " ").split()
+                if token in part_names
+            }
+        )
+        result["parses"] = self.package.parse_count - parses
+        result["schema_compiles"] = schema_registry.misses - compiles
+
+        self.check_results.append(result)
+        return passed
+
+    def _examine(self, *files):
+        """Record parts as examined by the running check, for report()."""
+        for file_path in files:
+            self._results.examined(self.package.relative_path(file_path).as_posix())
+
+    def _print_errors(self, errors):
+        """Print the errors of a failed check and record them for report()."""
+        for error in errors:
+            print(error)
+            self._results.error(error)
+
+    def save_part_results(self):
+        """Write the per-part results cached during validation to the manifest."""
+        if self.manifest is not None:
+            self.manifest.flush()
+
+    def _part_digest(self, file_path):
+        """Return the SHA-256 of a file's current contents ("-" if it is missing)."""
+        file_path = Path(file_path)
+        if file_path not in self._part_digests:
+            try:
+                self._part_digests[file_path] = self.package.digest(file_path)
+            except OSError:
+                self._part_digests[file_path] = "-"
+        return self._part_digests[file_path]
+
+    def _part_key(self, xml_file, dependencies):
+        """Return the cache key of a part: the hashes of it and its dependencies."""
+        return ":".join(self._part_digest(f) for f in (xml_file, *dependencies))
+
+    def _cached_part_result(self, check, xml_file, *dependencies):
+        """Return the manifest's cached result of a check for a part, or None.
+
+        A result is only reused if the part and every dependency (e.g. its .rels
+        file) still have the contents the result was computed from.
+        """
+        if self.manifest is None:
+            return None
+        return self.manifest.cached_result(
+            check,
+            self.package.relative_path(xml_file).as_posix(),
+            self._part_key(xml_file, dependencies),
+        )
+
+    def _store_part_result(self, check, xml_file, result, *dependencies):
+        """Cache the JSON-serialisable result of a check for a part."""
+        if self.manifest is not None:
+            self.manifest.store_result(
+                check,
+                self.package.relative_path(xml_file).as_posix(),
+                self._part_key(xml_file, dependencies),
+                result,
+            )
+
+    def _cached_part_check(self, check, xml_file, compute, *dependencies):
+        """Run a per-part check, reusing its cached result if the part is unchanged.
+
+        Args:
+            check: Name of the check in the manifest
+            xml_file: Part the check runs on
+            compute: Callable returning the JSON-serialisable result for the part
+            *dependencies: Other files the result depends on
+
+        Returns:
+            The cached or freshly computed result
+        """
+        result = self._cached_part_result(check, xml_file, *dependencies)
+        if result is None:
+            result = compute()
+            self._store_part_result(check, xml_file, result, *dependencies)
+        return result
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
+            self._examine(xml_file)
+            errors.extend(
+                self._cached_part_check(
+                    "xml", xml_file, lambda: self._well_formedness_errors(xml_file)
                 )
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
-            for error in errors:
-                print(error)
+            self._print_errors(errors)
             return False
         else:
             if self.verbose:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    def _well_formedness_errors(self, xml_file):
+        """Return the well-formedness errors of a single part."""
+        try:
+            # Try to parse the XML file
+            self.package.parse(xml_file)
+        except lxml.etree.XMLSyntaxError as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Line {e.lineno}: {e.msg}"
+            ]
+        except Exception as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Unexpected error: {str(e)}"
+            ]
+        return []
+
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+            self._examine(xml_file)
+            errors.extend(
+                self._cached_part_check(
+                    "namespaces", xml_file, lambda: self._namespace_errors(xml_file)
+                )
+            )
 
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
-            for error in errors:
-                print(error)
+            self._print_errors(errors)
             return False
         if self.verbose:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    def _namespace_errors(self, xml_file):
+        """Return the undeclared Ignorable namespace prefixes of a single part."""
+        errors = []
+        try:
+            root = self.package.getroot(xml_file)
+            declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
+
+            for attr_val in [
+                v for k, v in root.attrib.items() if k.endswith("Ignorable")
+            ]:
+                undeclared = set(attr_val.split()) - declared
+                errors.extend(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Namespace '{ns}' in Ignorable but not declared"
+                    for ns in sorted(undeclared)
+                )
+        except lxml.etree.XMLSyntaxError:
+            pass
+        return errors
+
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
+            self._examine(xml_file)
+            # File-scope errors are final per part; global IDs are merged across parts
+            entries = self._cached_part_check(
+                "unique_ids", xml_file, lambda: self._collect_unique_ids(xml_file)
+            )
+            for entry in entries:
+                if entry[0] == "error":
+                    errors.append(entry[1])
+                    continue
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                _, id_value, line, tag = entry
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                    )
+                else:
+                    global_ids[id_value] = (
+                        xml_file.relative_to(self.unpacked_dir),
+                        line,
+                        tag,
                     )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
-            for error in errors:
-                print(error)
+            self._print_errors(errors)
             return False
         else:
             if self.verbose:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _collect_unique_ids(self, xml_file):
+        """Collect the ID uniqueness findings of a single part.
+
+        Returns:
+            list: In document order, ["error", message] entries for file-scope
+                violations and ["global", id, line, tag] entries for IDs that must
+                be unique across all parts
+        """
+        entries = []
+        try:
+            root = self.package.getroot(xml_file)
+            file_ids = {}  # Track IDs that must be unique within this file
+
+            # Check IDs outside mc:AlternateContent (the shared tree is read-only,
+            # so those subtrees are skipped rather than removed)
+            for elem in root.xpath(
+                "descendant-or-self::*[not(ancestor-or-self::mc:AlternateContent)]",
+                namespaces={"mc": self.MC_NAMESPACE},
+            ):
+                # Get the element name without namespace
+                tag = (
+                    elem.tag.split("}")[-1].lower()
+                    if "}" in elem.tag
+                    else elem.tag.lower()
+                )
+
+                # Check if this element type has ID uniqueness requirements
+                if tag in self.UNIQUE_ID_REQUIREMENTS:
+                    attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                    # Look for the specified attribute
+                    id_value = None
+                    for attr, value in elem.attrib.items():
+                        attr_local = (
+                            attr.split("}")[-1].lower() if "}" in attr else attr.lower()
+                        )
+                        if attr_local == attr_name:
+                            id_value = value
+                            break
+
+                    if id_value is not None:
+                        if scope == "global":
+                            entries.append(["global", id_value, elem.sourceline, tag])
+                        elif scope == "file":
+                            # Check file-level uniqueness
+                            key = (tag, attr_name)
+                            if key not in file_ids:
+                                file_ids[key] = {}
+
+                            if id_value in file_ids[key]:
+                                prev_line = file_ids[key][id_value]
+                                entries.append(
+                                    [
+                                        "error",
+                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                        f"(first occurrence at line {prev_line})",
+                                    ]
+                                )
+                            else:
+                                file_ids[key][id_value] = elem.sourceline
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            entries.append(
+                ["error", f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"]
+            )
+        return entries
+
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
         """
         errors = []
 
-        # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        graph = self.package.graph
 
-        if not rels_files:
+        if not graph.rels_files:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
-
-        # Track all files that are referenced by any .rels file
-        all_referenced_files = set()
-
         if self.verbose:
             print(
-                f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
+                f"Found {len(graph.rels_files)} .rels files and {len(graph.parts)} target files"
             )
 
-        # Check each .rels file
-        for rels_file in rels_files:
+        # Report relationships whose target does not exist
+        for rels_file in graph.rels_files:
+            self._examine(rels_file)
+            rel_path = rels_file.relative_to(self.unpacked_dir)
             try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
-
-                # Find all relationships and their targets
-                referenced_files = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
-                        else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
-
+                relationships = graph.relationships(rels_file)
             except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
                 errors.append(f"  Error parsing {rel_path}: {e}")
+                continue
 
-        # Check for unreferenced files (files that exist but are not referenced anywhere)
-        unreferenced_files = set(all_files) - all_referenced_files
+            for rel in relationships:
+                if graph.is_dangling(rel):
+                    errors.append(
+                        f"  {rel_path}: Line {rel.line}: Broken reference to {rel.target}"
+                    )
 
-        if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+        # Check for unreferenced files (files that exist but are not referenced anywhere)
+        self._examine(*graph.parts)
+        for unref_file in graph.orphans():
+            unref_rel_path = unref_file.relative_to(self.unpacked_dir)
+            errors.append(f"  Unreferenced file: {unref_rel_path}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
-            for error in errors:
-                print(error)
+            self._print_errors(errors)
             print(
                 "CRITICAL: These errors will cause the document to appear corrupt. "
                 + "Broken references MUST be fixed, "
@@ -390,8 +600,6 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
@@ -402,80 +610,26 @@ class BaseSchemaValidator:
 
             # Determine the corresponding .rels file
             # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
+            rels_file = self.package.rels_file_for(xml_file)
 
             # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
+            if not self.package.graph.has_rels(xml_file):
                 continue
-
-            try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
-
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
-
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
-
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+            self._examine(xml_file, rels_file)
+
+            # r:id references only depend on the part and its .rels file
+            errors.extend(
+                self._cached_part_check(
+                    f"relationship_ids:{type(self).__name__}",
+                    xml_file,
+                    lambda: self._relationship_id_errors(xml_file, rels_file),
+                    rels_file,
+                )
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
-            for error in errors:
-                print(error)
+            self._print_errors(errors)
             print("\nThese ID mismatches will cause the document to appear corrupt!")
             return False
         else:
@@ -483,6 +637,70 @@ class BaseSchemaValidator:
                 print("PASSED - All relationship ID references are valid")
             return True
 
+    def _relationship_id_errors(self, xml_file, rels_file):
+        """Return the r:id reference errors of a part against its .rels file."""
+        errors = []
+        try:
+            # Get valid relationship IDs and their types from the .rels file
+            rid_to_type = {}
+
+            for rel in self.package.graph.relationships(rels_file):
+                rid = rel.rid
+                rel_type = rel.type
+                if rid:
+                    # Check for duplicate rIds
+                    if rid in rid_to_type:
+                        rels_rel_path = rels_file.relative_to(self.unpacked_dir)
+                        errors.append(
+                            f"  {rels_rel_path}: Line {rel.line}: "
+                            f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+                        )
+                    # Extract just the type name from the full URL
+                    type_name = (
+                        rel_type.split("/")[-1] if "/" in rel_type else rel_type
+                    )
+                    rid_to_type[rid] = type_name
+
+            # Find all r:id references in the XML file
+            xml_root = self.package.getroot(xml_file)
+
+            # Find all elements with r:id attributes
+            for elem in xml_root.iter():
+                # Check for r:id attribute (relationship ID)
+                rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
+                if rid_attr:
+                    xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+                    elem_name = (
+                        elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+                    )
+
+                    # Check if the ID exists
+                    if rid_attr not in rid_to_type:
+                        errors.append(
+                            f"  {xml_rel_path}: Line {elem.sourceline}: "
+                            f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                            f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                        )
+                    # Check if we have type expectations for this element
+                    elif self.ELEMENT_RELATIONSHIP_TYPES:
+                        expected_type = self._get_expected_relationship_type(
+                            elem_name
+                        )
+                        if expected_type:
+                            actual_type = rid_to_type[rid_attr]
+                            # Check if the actual type matches or contains the expected type
+                            if expected_type not in actual_type.lower():
+                                errors.append(
+                                    f"  {xml_rel_path}: Line {elem.sourceline}: "
+                                    f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                    f"but should point to a '{expected_type}' relationship"
+                                )
+
+        except Exception as e:
+            xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+            errors.append(f"  Error processing {xml_rel_path}: {e}")
+        return errors
+
     def _get_expected_relationship_type(self, element_name):
         """
         Get the expected relationship type for an element.
@@ -525,31 +743,15 @@ class BaseSchemaValidator:
 
         # Find [Content_Types].xml file
         content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        if not self.package.exists(content_types_file):
             print("FAILED - [Content_Types].xml file not found")
+            self._results.error("[Content_Types].xml file not found")
             return False
+        self._examine(content_types_file)
 
         try:
-            # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts = set()
-            declared_extensions = set()
-
-            # Get Override declarations (specific files)
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
-
-            # Get Default declarations (by extension)
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+            # Declared parts and extensions are looked up in the package graph
+            graph = self.package.graph
 
             # Root elements that require content type declaration
             declarable_roots = {
@@ -575,10 +777,6 @@ class BaseSchemaValidator:
                 "emf": "image/x-emf",
             }
 
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
-
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
                 path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
@@ -591,31 +789,29 @@ class BaseSchemaValidator:
                     for skip in [".rels", "[Content_Types]", "docProps/", "_rels/"]
                 ):
                     continue
+                self._examine(xml_file)
 
-                try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
-
-                    if root_name in declarable_roots and path_str not in declared_parts:
-                        errors.append(
-                            f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
-                        )
+                # Empty for unparseable files, which are skipped
+                root_name = self._cached_part_check(
+                    "root_tag", xml_file, lambda: self._root_name(xml_file)
+                )
 
-                except Exception:
-                    continue  # Skip unparseable files
+                if root_name in declarable_roots and not graph.has_override(xml_file):
+                    errors.append(
+                        f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
+                    )
 
             # Check all non-XML files for Default extension declarations
-            for file_path in all_files:
+            for file_path in graph.parts:
                 # Skip XML files and metadata files (already checked above)
-                if file_path.suffix.lower() in {".xml", ".rels"}:
-                    continue
-                if file_path.name == "[Content_Types].xml":
+                if file_path.suffix.lower() == ".xml":
                     continue
                 if "_rels" in file_path.parts or "docProps" in file_path.parts:
                     continue
+                self._examine(file_path)
 
                 extension = file_path.suffix.lstrip(".").lower()
-                if extension and extension not in declared_extensions:
+                if extension and not graph.has_default(extension):
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
                         relative_path = file_path.relative_to(self.unpacked_dir)
@@ -628,8 +824,7 @@ class BaseSchemaValidator:
 
         if errors:
             print(f"FAILED - Found {len(errors)} content type declaration errors:")
-            for error in errors:
-                print(error)
+            self._print_errors(errors)
             return False
         else:
             if self.verbose:
@@ -638,6 +833,14 @@ class BaseSchemaValidator:
                 )
             return True
 
+    def _root_name(self, xml_file):
+        """Return the local name of a part's root element, or "" if unparseable."""
+        try:
+            root_tag = self.package.getroot(xml_file).tag
+        except Exception:
+            return ""
+        return root_tag.split("}")[-1] if "}" in root_tag else root_tag
+
     def validate_file_against_xsd(self, xml_file, verbose=False):
         """Validate a single XML file against XSD schema, comparing with original.
 
@@ -649,12 +852,12 @@ class BaseSchemaValidator:
             tuple: (is_valid, new_errors_set) where is_valid is True/False/None (skipped)
         """
         # Resolve both paths to handle symlinks
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
+        xml_file = self.package.resolve(xml_file)
+        unpacked_dir = self.unpacked_dir
 
         # Validate current file
         is_valid, current_errors = self._validate_single_file_xsd(
-            xml_file, unpacked_dir
+            xml_file, self.package
         )
 
         if is_valid is None:
@@ -662,18 +865,13 @@ class BaseSchemaValidator:
         elif is_valid:
             return True, set()  # Valid, no errors
 
-        # Get errors from original file for this specific file
-        original_errors = self._get_original_file_errors(xml_file)
-
-        # Compare with original (both are guaranteed to be sets here)
-        assert current_errors is not None
-        new_errors = current_errors - original_errors
+        new_errors = self._get_new_errors(xml_file, current_errors)
 
         if new_errors:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -685,6 +883,15 @@ class BaseSchemaValidator:
                 )
             return True, set()
 
+    def _get_new_errors(self, xml_file, current_errors):
+        """Return the XSD errors of a part that did not exist in the original."""
+        # Get errors from original file for this specific file
+        original_errors = self._get_original_file_errors(xml_file)
+
+        # Compare with original (both are guaranteed to be sets here)
+        assert current_errors is not None
+        return current_errors - original_errors
+
     def validate_against_xsd(self):
         """Validate XML files against XSD schemas, showing only new errors compared to original."""
         new_errors = []
@@ -692,19 +899,40 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
+        # Reuse the results of unchanged parts and validate the rest up front
+        # (sharded across workers when jobs > 1)
+        results = {}
+        pending = []
         for xml_file in self.xml_files:
-            relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
+            cached = self._cached_part_result("xsd", xml_file)
+            if cached is None:
+                pending.append(xml_file)
+            else:
+                is_valid, errors = cached
+                results[xml_file] = (is_valid, None if errors is None else set(errors))
+
+        for xml_file, (is_valid, errors) in self._validate_parts_xsd(
+            pending, self.package
+        ).items():
+            results[xml_file] = (is_valid, errors)
+            self._store_part_result(
+                "xsd", xml_file, [is_valid, None if errors is None else sorted(errors)]
             )
 
+        for xml_file in self.xml_files:
+            self._examine(xml_file)
+            relative_path = str(xml_file.relative_to(self.unpacked_dir))
+            is_valid, current_errors = results[xml_file]
+
             if is_valid is None:
                 skipped_count += 1
                 continue
-            elif is_valid and not new_file_errors:
+            elif is_valid:
                 valid_count += 1
                 continue
-            elif is_valid:
+
+            new_file_errors = self._get_new_errors(xml_file, current_errors)
+            if not new_file_errors:
                 # Had errors but all existed in original
                 original_error_count += 1
                 valid_count += 1
@@ -712,7 +940,7 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
@@ -727,17 +955,78 @@ class BaseSchemaValidator:
             print(
                 f"  - With NEW errors: {len(new_errors) > 0 and len([e for e in new_errors if not e.startswith('    ')]) or 0}"
             )
+            stats = schema_registry.stats()
+            print(
+                f"Schema cache: {stats['compiled']} compiled, "
+                f"{stats['hits']} hits, {stats['misses']} misses"
+            )
 
         if new_errors:
             print("\nFAILED - Found NEW validation errors:")
-            for error in new_errors:
-                print(error)
+            self._print_errors(new_errors)
             return False
         else:
             if self.verbose:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_parts_xsd(self, xml_files, package):
+        """XSD-validate parts of a package, in worker processes when jobs > 1.
+
+        Parts are sharded across a process pool whose workers are warmed with the
+        compiled schemas the package needs. Results are keyed by part, so callers
+        iterate in their own order and the output matches the serial run.
+
+        Args:
+            xml_files: Parts of the package to validate
+            package: OOXMLPackage the parts belong to
+
+        Returns:
+            dict: Map of part path to (is_valid, errors_set) as returned by
+                _validate_single_file_xsd
+        """
+        # Workers open the packages by path, so in-memory packages stay serial
+        if (
+            self.jobs <= 1
+            or len(xml_files) < 2
+            or package.in_memory
+            or is_in_memory(self.original_file)
+        ):
+            return {
+                xml_file: self._validate_single_file_xsd(xml_file, package)
+                for xml_file in xml_files
+            }
+
+        # Largest parts first, dealt round-robin so shards have similar cost
+        relative_paths = [
+            package.relative_path(f).as_posix()
+            for f in sorted(xml_files, key=package.size, reverse=True)
+        ]
+        shard_count = min(len(relative_paths), self.jobs * 4)
+        shards = [relative_paths[i::shard_count] for i in range(shard_count)]
+        schema_paths = sorted(
+            {str(p) for p in map(self._get_schema_path, xml_files) if p is not None}
+        )
+
+        results = {}
+        with ProcessPoolExecutor(
+            max_workers=min(self.jobs, shard_count),
+            initializer=_init_xsd_worker,
+            initargs=(
+                type(self),
+                str(package.root_dir),
+                str(self.original_file),
+                schema_paths,
+            ),
+        ) as executor:
+            for shard_results in executor.map(_validate_xsd_shard, shards):
+                for relative_path, is_valid, errors in shard_results:
+                    results[package.root_dir / relative_path] = (
+                        is_valid,
+                        set(errors) if errors is not None else None,
+                    )
+        return results
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -763,54 +1052,34 @@ class BaseSchemaValidator:
         return None
 
     def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
-
-        # Remove attributes not in allowed namespaces
-        for elem in xml_copy.iter():
-            attrs_to_remove = []
-
-            for attr in elem.attrib:
-                # Check if attribute is from a namespace other than allowed ones
-                if "{" in attr:
-                    ns = attr.split("}")[0][1:]
-                    if ns not in self.OOXML_NAMESPACES:
-                        attrs_to_remove.append(attr)
-
-            # Remove collected attributes
-            for attr in attrs_to_remove:
-                del elem.attrib[attr]
-
-        # Remove elements not in allowed namespaces
-        self._remove_ignorable_elements(xml_copy)
-
-        return lxml.etree.ElementTree(xml_copy)
+        """Remove attributes and elements not in allowed namespaces, in place.
 
-    def _remove_ignorable_elements(self, root):
-        """Recursively remove all elements not in allowed namespaces."""
+        The tree is modified directly in a single pass, so it must be a copy owned
+        by the caller, never a tree from the package's shared parse cache.
+        """
+        root = xml_doc.getroot()
         elements_to_remove = []
 
-        # Find elements to remove
-        for elem in list(root):
-            # Skip non-element nodes (comments, processing instructions, etc.)
-            if not hasattr(elem, "tag") or callable(elem.tag):
+        # Skip non-element nodes (comments, processing instructions, etc.)
+        for elem in root.iter(tag=lxml.etree.Element):
+            # Remove elements not in allowed namespaces (never the root itself)
+            if elem is not root and self._is_foreign_name(elem.tag):
+                elements_to_remove.append(elem)
                 continue
 
-            tag_str = str(elem.tag)
-            if tag_str.startswith("{"):
-                ns = tag_str.split("}")[0][1:]
-                if ns not in self.OOXML_NAMESPACES:
-                    elements_to_remove.append(elem)
-                    continue
+            # Remove attributes not in allowed namespaces
+            for attr in [a for a in elem.attrib if self._is_foreign_name(a)]:
+                del elem.attrib[attr]
 
-            # Recursively clean child elements
-            self._remove_ignorable_elements(elem)
+        # Innermost first; removed elements take their content and tail text along
+        for elem in reversed(elements_to_remove):
+            elem.getparent().remove(elem)
 
-        # Remove collected elements
-        for elem in elements_to_remove:
-            root.remove(elem)
+        return xml_doc
+
+    def _is_foreign_name(self, name):
+        """Return True if a {namespace}name is outside the allowed namespaces."""
+        return name[0] == "{" and name[1 : name.index("}")] not in self.OOXML_NAMESPACES
 
     def _preprocess_for_mc_ignorable(self, xml_doc):
         """Preprocess XML to handle mc:Ignorable attribute properly."""
@@ -823,30 +1092,28 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _validate_single_file_xsd(self, xml_file, package):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        The part's tree is taken from the package's parse cache; all preprocessing
+        happens on a copy so the shared tree is left untouched.
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            # Load schema (compiled once per process)
+            schema = schema_registry.get(schema_path)
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            # Load and preprocess XML (the template tag pass returns a copy)
+            xml_doc = package.parse(xml_file)
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
-            # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
+            # Clean ignorable namespaces if needed (in place, on the copy)
+            relative_path = package.relative_path(xml_file)
             if (
                 relative_path.parts
                 and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
@@ -875,33 +1142,66 @@ class BaseSchemaValidator:
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
-        # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
-        xml_file = Path(xml_file).resolve()
-        unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
+        # Resolve the path to handle symlinks (e.g., /var vs /private/var on macOS)
+        relative_path = self.package.relative_path(self.package.resolve(xml_file))
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        return self._get_original_error_index().get(relative_path.as_posix(), set())
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+    def _get_original_error_index(self):
+        """Get the XSD errors of every part in the original document.
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        The index is built in a single pass over the original file, memoised on the
+        validator and persisted in the validation cache keyed by the original file's
+        content hash, the validator class and the schemas it validates against, so
+        later validations against the same original reuse it.
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+        Returns:
+            dict: Map of part path (posix, relative to the package root) to the set
+                of XSD error messages for that part. Parts without errors are omitted.
+        """
+        if self._original_error_index is not None:
+            return self._original_error_index
+
+        if is_in_memory(self.original_file):
+            # Nothing is read from or written to disk for in-memory originals
+            self._original_error_index = self._build_original_error_index()
+            return self._original_error_index
+
+        original_hash = hash_file(self.original_file)
+        schemas_hash = hash_directory(self.schemas_dir)
+        cache_key = (
+            f"v{self.BASELINE_INDEX_VERSION}-{type(self).__name__}"
+            f"-{schemas_hash[:16]}-{original_hash}"
+        )
+        cached = read_cache_entry("baseline", cache_key)
+        if cached is not None:
+            self._original_error_index = {
+                part: set(errors) for part, errors in cached.items()
+            }
+            return self._original_error_index
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
+        index = self._build_original_error_index()
+        write_cache_entry(
+            "baseline",
+            cache_key,
+            {part: sorted(errors) for part, errors in index.items()},
+        )
+        self._original_error_index = index
+        return index
+
+    def _build_original_error_index(self):
+        """XSD-validate every part of the original document straight from the zip."""
+        index = {}
+        with OOXMLPackage(self.original_file) as original_package:
+            results = self._validate_parts_xsd(
+                original_package.xml_files, original_package
             )
-            return errors if errors else set()
+            for original_xml_file, (is_valid, errors) in results.items():
+                if errors:
+                    relative_path = original_package.relative_path(original_xml_file)
+                    index[relative_path.as_posix()] = errors
+
+        return index
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -916,9 +1216,8 @@ class BaseSchemaValidator:
         warnings = []
         template_pattern = re.compile(r"\{\{[^}]*\}\}")
 
-        # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        # Copy the tree (without serializing it) to leave the original untouched
+        xml_copy = copy.deepcopy(xml_doc)
 
         def process_text_content(text, content_type):
             if not text:
@@ -933,7 +1232,7 @@ class BaseSchemaValidator:
             return text
 
         # Process all text nodes in the document
-        for elem in xml_copy.iter():
+        for elem in xml_copy.getroot().iter():
             # Skip processing if this is a w:t element
             if not hasattr(elem, "tag") or callable(elem.tag):
                 continue
@@ -944,7 +1243,41 @@ class BaseSchemaValidator:
             elem.text = process_text_content(elem.text, "text content")
             elem.tail = process_text_content(elem.tail, "tail content")
 
-        return lxml.etree.ElementTree(xml_copy), warnings
+        return xml_copy, warnings
+
+
+# Validator instance owned by each XSD worker process
+_xsd_worker_validator = None
+
+
+def _init_xsd_worker(validator_cls, root_dir, original_file, schema_paths):
+    """Create the worker's validator and compile the schemas it will need."""
+    global _xsd_worker_validator
+    _xsd_worker_validator = validator_cls(root_dir, original_file)
+    for schema_path in schema_paths:
+        try:
+            schema_registry.get(schema_path)
+        except Exception:
+            pass  # Reported per part by _validate_single_file_xsd
+
+
+def _validate_xsd_shard(relative_paths):
+    """Validate a shard of parts in a worker process.
+
+    Returns:
+        list: (relative_path, is_valid, sorted_errors) tuples
+    """
+    validator = _xsd_worker_validator
+    package = validator.package
+    results = []
+    for relative_path in relative_paths:
+        is_valid, errors = validator._validate_single_file_xsd(
+            package.root_dir / relative_path, package
+        )
+        results.append(
+            (relative_path, is_valid, sorted(errors) if errors is not None else None)
+        )
+    return results
 
 
 if __name__ == "__main__":
@@ -0,0 +1,84 @@
+"""
+On-disk cache for validation results that only depend on file contents.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+# Environment variable that overrides the cache location
+CACHE_DIR_ENV = "OOXML_VALIDATION_CACHE"
+
+
+def get_cache_dir():
+    """Return the directory used for cached validation results."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / ".cache" / "ooxml-validation"
+
+
+def hash_file(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def hash_directory(path):
+    """Return the SHA-256 hex digest of the names and contents of a directory's files.
+
+    Computed once per process and directory; the directory (e.g. the bundled
+    schemas) is not expected to change while the process runs.
+    """
+    path = Path(path)
+    digest = hashlib.sha256()
+    for file_path in sorted(p for p in path.rglob("*") if p.is_file()):
+        digest.update(file_path.relative_to(path).as_posix().encode("utf-8") + b"\0")
+        digest.update(hash_file(file_path).encode("ascii"))
+    return digest.hexdigest()
+
+
+def read_cache_entry(namespace, key):
+    """Load a cached JSON entry.
+
+    Args:
+        namespace: Cache subdirectory (e.g. "baseline")
+        key: Entry key, typically a content hash
+
+    Returns:
+        dict or None: The cached data, or None if missing or unreadable
+    """
+    entry = get_cache_dir() / namespace / f"{key}.json"
+    try:
+        with open(entry, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache_entry(namespace, key, data):
+    """Store a JSON entry atomically. Failures are ignored (the cache is optional)."""
+    entry_dir = get_cache_dir() / namespace
+    try:
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, entry_dir / f"{key}.json")
+    except OSError:
+        Path(temp_path).unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,354 @@
+"""
+Parse-once model of an Office package shared by all validation checks.
+"""
+
+import hashlib
+import io
+import os
+import zipfile
+from pathlib import Path, PurePosixPath
+
+import lxml.etree
+
+from .graph import PackageGraph
+from .manifest import MANIFEST_NAME, PartManifest
+from .parts import PackageParts, is_in_memory, open_archive
+
+
+class OOXMLPackage:
+    """Parse-once model of an Office package.
+
+    The package is either an unpacked directory or a packed Office file. A packed
+    file is read in place: members are streamed from the archive straight into
+    lxml and nothing is extracted to disk. Parts are addressed by path in both
+    cases; for a packed file these are virtual paths below the archive path
+    (e.g. report.docx/word/document.xml), so checks should use exists(),
+    is_file() and open() rather than the filesystem.
+
+    Packages held in memory are supported as well: a PackageParts (unpacked) or
+    a bytes-like or file object holding a packed file. Their parts get virtual
+    paths below /<memory>/<name>.
+
+    Parts that a lazy unpack left in the source Office file are read from that
+    file (recorded in the directory's manifest) until they are materialised.
+
+    Every XML part is parsed at most once and the resulting tree is shared by
+    all validation checks. Relationship lists and content-type tables are
+    derived from those trees and cached as well.
+
+    The cached trees are shared, so checks must treat them as read-only and
+    work on a copy whenever they need to modify a tree.
+
+    Attributes:
+        root_dir: Resolved path to the unpacked directory or the packed file
+            (virtual for packages in memory)
+        in_memory: True if the package is held in memory
+        xml_files: All XML and .rels parts in the package
+        parse_count: Number of times an XML part was actually parsed
+    """
+
+    PACKAGE_RELATIONSHIPS_NAMESPACE = (
+        "http://schemas.openxmlformats.org/package/2006/relationships"
+    )
+    CONTENT_TYPES_NAMESPACE = (
+        "http://schemas.openxmlformats.org/package/2006/content-types"
+    )
+
+    def __init__(self, root_dir):
+        self.in_memory = is_in_memory(root_dir)
+        self._zip = None
+        self._members = None  # Member name -> ZipInfo or content; None for a directory
+        self._lazy = {}
+        self._lazy_source = None
+
+        if isinstance(root_dir, PackageParts):
+            # Unpacked package in memory: a snapshot of its current contents
+            self.root_dir = Path("/<memory>") / root_dir.name
+            self._members = dict(root_dir)
+        elif self.in_memory:
+            # Packed file in memory: read in place like a packed file on disk
+            self.root_dir = Path("/<memory>") / "package"
+            self._zip = open_archive(root_dir)
+        else:
+            self.root_dir = Path(root_dir).resolve()
+            if self.root_dir.is_file():
+                self._zip = zipfile.ZipFile(self.root_dir)
+
+        if self._zip is not None:
+            # Packed file: index the archive members, skipping directory entries
+            self._members = {
+                info.filename: info
+                for info in self._zip.infolist()
+                if not info.is_dir()
+            }
+
+        if self._members is not None:
+            self.xml_files = [
+                self.root_dir / name
+                for suffix in (".xml", ".rels")
+                for name in self._members
+                if name.endswith(suffix)
+            ]
+        else:
+            self._open_lazy_source()
+
+            # Get all XML and .rels files
+            self.xml_files = [
+                f
+                for suffix in (".xml", ".rels")
+                for f in [
+                    *self.root_dir.rglob(f"*{suffix}"),
+                    *(p for p in self._lazy if p.name.endswith(suffix)),
+                ]
+            ]
+
+        self.parse_count = 0
+        self._trees = {}  # Path -> ElementTree or the exception raised while parsing
+        self._all_files = None
+        self._content_types = None
+        self._graph = None
+
+    def _open_lazy_source(self):
+        """Index the parts of an unpacked directory still held in its source file."""
+        manifest = PartManifest.load(self.root_dir)
+        if manifest is None:
+            return
+        lazy = {
+            self.root_dir / name: name
+            for name in manifest.lazy_parts()
+            if not (self.root_dir / name).exists()
+        }
+        if not lazy:
+            return
+        try:
+            self._lazy_source = manifest.open_source()
+        except ValueError:
+            return  # The parts are reported as missing by the checks
+        self._lazy = lazy  # Path -> member name in self._lazy_source
+
+    def _lazy_member(self, file_path):
+        """Return the source member of a part not yet materialised, or None."""
+        if not self._lazy:
+            return None
+        name = self._lazy.get(Path(file_path))
+        if name is None or Path(file_path).exists():
+            return None
+        return name
+
+    @property
+    def is_packed(self):
+        """True if the package is read directly from a packed Office file."""
+        return self._zip is not None
+
+    def _open_member(self, name):
+        """Open a member of a packed or in-memory package for binary reading."""
+        if self._zip is not None:
+            return self._zip.open(self._members[name])
+        return io.BytesIO(self._members[name])
+
+    def close(self):
+        """Close the underlying archive of a packed or lazily unpacked package."""
+        if self._zip is not None:
+            self._zip.close()
+        if self._lazy_source is not None:
+            self._lazy_source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _member_name(self, file_path):
+        """Return the member name of a path below a packed or in-memory package."""
+        return self.relative_path(file_path).as_posix()
+
+    def exists(self, file_path):
+        """Return True if a path exists in the package."""
+        if self._members is None:
+            return Path(file_path).exists() or self._lazy_member(file_path) is not None
+        return self.is_file(file_path)
+
+    def is_file(self, file_path):
+        """Return True if a path names a regular file in the package."""
+        if self._members is None:
+            return Path(file_path).is_file() or self._lazy_member(file_path) is not None
+        try:
+            return self._member_name(file_path) in self._members
+        except ValueError:
+            return False
+
+    def resolve(self, file_path):
+        """Return a normalised absolute path for a file in the package."""
+        if self._members is None:
+            return Path(file_path).resolve()
+        return Path(os.path.normpath(file_path))
+
+    def open(self, file_path):
+        """Open a file in the package for binary reading."""
+        if self._members is None:
+            name = self._lazy_member(file_path)
+            if name is not None:
+                return self._lazy_source.open(name)
+            return open(file_path, "rb")
+        return self._open_member(self._member_name(file_path))
+
+    def size(self, file_path):
+        """Return the uncompressed size of a file in the package."""
+        if self._members is None:
+            name = self._lazy_member(file_path)
+            if name is not None:
+                return self._lazy_source.getinfo(name).file_size
+            return Path(file_path).stat().st_size
+        member = self._members[self._member_name(file_path)]
+        return member.file_size if self._zip is not None else len(member)
+
+    def digest(self, file_path):
+        """Return the SHA-256 hex digest of a file's contents."""
+        digest = hashlib.sha256()
+        with self.open(file_path) as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def glob(self, pattern):
+        """Return the files matching a pattern relative to the package root."""
+        if self._members is None:
+            return list(self.root_dir.glob(pattern)) + self._match_members(
+                self._lazy.values(), pattern
+            )
+        return self._match_members(self._members, pattern)
+
+    def _match_members(self, names, pattern):
+        """Return the paths of the member names matching a relative pattern."""
+        depth = len(PurePosixPath(pattern).parts)
+        return [
+            self.root_dir / name
+            for name in names
+            if len(PurePosixPath(name).parts) == depth
+            and PurePosixPath(name).match(pattern)
+        ]
+
+    def parse(self, xml_file):
+        """Return the parsed tree for a part, parsing it on first access.
+
+        Args:
+            xml_file: Path to the XML part inside the package
+
+        Returns:
+            lxml.etree._ElementTree: Shared, read-only parsed tree
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the part is not well-formed (the error
+                is cached and re-raised on every access)
+        """
+        xml_file = Path(xml_file)
+        if xml_file not in self._trees:
+            self.parse_count += 1
+            try:
+                if self._members is None and self._lazy_member(xml_file) is None:
+                    self._trees[xml_file] = lxml.etree.parse(str(xml_file))
+                else:
+                    with self.open(xml_file) as f:
+                        self._trees[xml_file] = lxml.etree.parse(f)
+            except Exception as e:
+                self._trees[xml_file] = e
+
+        tree = self._trees[xml_file]
+        if isinstance(tree, Exception):
+            raise tree
+        return tree
+
+    def getroot(self, xml_file):
+        """Return the root element of a part's shared parsed tree."""
+        return self.parse(xml_file).getroot()
+
+    def relative_path(self, file_path):
+        """Return the path of a file relative to the package root."""
+        return Path(file_path).relative_to(self.root_dir)
+
+    @property
+    def all_files(self):
+        """All regular files in the package (except the manifest), resolved, in walk order."""
+        if self._all_files is None:
+            if self._members is not None:
+                self._all_files = [self.root_dir / name for name in self._members]
+            else:
+                self._all_files = [
+                    f.resolve()
+                    for f in self.root_dir.rglob("*")
+                    if f.is_file() and f.name != MANIFEST_NAME
+                ] + list(self._lazy)
+        return self._all_files
+
+    @staticmethod
+    def rels_file_for(xml_file):
+        """Return the .rels path for a part (dir/file.xml -> dir/_rels/file.xml.rels)."""
+        xml_file = Path(xml_file)
+        return xml_file.parent / "_rels" / f"{xml_file.name}.rels"
+
+    def relationships(self, rels_file):
+        """Return the Relationship elements declared in a .rels part."""
+        return self.getroot(rels_file).findall(
+            f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+        )
+
+    def relationship_types(self, rels_file):
+        """Return a map of relationship ID to relationship type URI for a .rels part."""
+        return {
+            rel.get("Id"): rel.get("Type", "")
+            for rel in self.relationships(rels_file)
+            if rel.get("Id")
+        }
+
+    @property
+    def graph(self):
+        """Relationship and content-type graph of the package, built on first use."""
+        if self._graph is None:
+            self._graph = PackageGraph(self)
+        return self._graph
+
+    def content_types(self):
+        """Return the content-type tables declared in [Content_Types].xml.
+
+        Returns:
+            tuple: (overrides, defaults) where overrides maps part names (without
+                the leading '/') to content types and defaults maps lowercase
+                extensions to content types
+
+        Raises:
+            FileNotFoundError: If [Content_Types].xml does not exist
+            lxml.etree.XMLSyntaxError: If [Content_Types].xml is not well-formed
+        """
+        if self._content_types is None:
+            content_types_file = self.root_dir / "[Content_Types].xml"
+            if not self.exists(content_types_file):
+                raise FileNotFoundError(f"{content_types_file} not found")
+
+            root = self.getroot(content_types_file)
+            overrides = {}
+            defaults = {}
+
+            # Override declarations (specific files)
+            for override in root.findall(
+                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
+            ):
+                part_name = override.get("PartName")
+                if part_name is not None:
+                    overrides[part_name.lstrip("/")] = override.get("ContentType")
+
+            # Default declarations (by extension)
+            for default in root.findall(
+                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
+            ):
+                extension = default.get("Extension")
+                if extension is not None:
+                    defaults[extension.lower()] = default.get("ContentType")
+
+            self._content_types = (overrides, defaults)
+
+        return self._content_types
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,104 @@
+"""
+Streaming paragraph scanner for Word document.xml parts.
+"""
+
+from collections import namedtuple
+
+import lxml.etree
+
+WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+ParagraphScan = namedtuple("ParagraphScan", ["text", "paragraph_count", "author_changes"])
+ParagraphScan.__doc__ = """Result of scan_paragraphs.
+
+Attributes:
+    text: Non-empty paragraph texts, one per line, with the author's tracked
+        changes rejected (insertions dropped, deletions restored)
+    paragraph_count: Number of w:p elements in the document as written
+    author_changes: Number of w:ins and w:del elements by the author
+"""
+
+
+def scan_paragraphs(source, author="Claude"):
+    """Extract paragraph text and counts from document.xml in a single pass.
+
+    The part is read with iterparse and every element is cleared as soon as it
+    has been processed, so memory use is bounded by the deepest open element
+    rather than by the size of the document.
+
+    Text is extracted as if the author's tracked changes were rejected: w:ins
+    elements by the author are dropped with their content, and w:delText inside
+    w:del elements by the author counts as regular text. Each w:p contributes the
+    text of all w:t elements below it (including those of nested paragraphs, e.g.
+    in text boxes), in document order.
+
+    Args:
+        source: Path or binary file object of a document.xml part
+        author: Author whose tracked changes are rejected
+
+    Returns:
+        ParagraphScan: Extracted text, paragraph count and author change count
+
+    Raises:
+        lxml.etree.XMLSyntaxError: If the part is not well-formed
+    """
+    w = f"{{{WORD_2006_NAMESPACE}}}"
+    p_tag, t_tag, del_text_tag = f"{w}p", f"{w}t", f"{w}delText"
+    ins_tag, del_tag = f"{w}ins", f"{w}del"
+    author_attr = f"{w}author"
+
+    paragraphs = []  # Paragraph texts in document order, filled in when closed
+    open_paragraphs = []  # (index, text parts) per open w:p, None if removed
+    removed_depth = 0  # Open w:ins elements by the author
+    restored_depth = 0  # Open w:del elements by the author
+    paragraph_count = 0
+    author_changes = 0
+
+    for event, elem in lxml.etree.iterparse(source, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == p_tag:
+                paragraph_count += 1
+                if removed_depth:
+                    open_paragraphs.append(None)
+                else:
+                    paragraphs.append(None)
+                    open_paragraphs.append((len(paragraphs) - 1, []))
+            elif tag in (ins_tag, del_tag) and elem.get(author_attr) == author:
+                author_changes += 1
+                if tag == ins_tag:
+                    removed_depth += 1
+                else:
+                    restored_depth += 1
+            continue
+
+        if tag == t_tag or (tag == del_text_tag and restored_depth):
+            if elem.text and not removed_depth:
+                for paragraph in open_paragraphs:
+                    if paragraph is not None:
+                        paragraph[1].append(elem.text)
+        elif tag == p_tag:
+            paragraph = open_paragraphs.pop()
+            if paragraph is not None:
+                paragraphs[paragraph[0]] = "".join(paragraph[1])
+        elif tag in (ins_tag, del_tag) and elem.get(author_attr) == author:
+            if tag == ins_tag:
+                removed_depth -= 1
+            else:
+                restored_depth -= 1
+
+        # Drop the processed element and its earlier siblings
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+    # Skip empty paragraphs - they don't affect content validation
+    return ParagraphScan(
+        "\n".join(text for text in paragraphs if text),
+        paragraph_count,
+        author_changes,
+    )
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
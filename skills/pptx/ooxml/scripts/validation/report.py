@@ -0,0 +1,73 @@
+"""
+Timing and structured results for validation checks.
+"""
+
+import os
+import time
+
+
+def cpu_time():
+    """Return the CPU time used by this process and its finished children."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+class CheckResults:
+    """Findings recorded by a check while it runs, for its report entry.
+
+    Checks print their findings for people and record them here for the JSON
+    report: each error with error() and each part they look at with examined().
+
+    Attributes:
+        errors: Error messages, without indentation
+        parts: Names of the parts the check examined
+    """
+
+    def __init__(self):
+        self.errors = []
+        self.parts = set()
+
+    def error(self, message):
+        """Record an error message."""
+        self.errors.append(message.strip())
+
+    def examined(self, part_name):
+        """Record a part as examined."""
+        self.parts.add(part_name)
+
+
+def run_check(name, check, results=None):
+    """Run a check, timing it and collecting the findings it records.
+
+    Args:
+        name: Name of the check in the report
+        check: Callable returning True if the check passed, which records its
+            errors and examined parts in results
+        results: CheckResults for the check to record into (default: a new one)
+
+    Returns:
+        tuple: (passed, result) where result is a JSON-serialisable dict with the
+            check's name, status ("passed"/"failed"), errors (those recorded by a
+            failed check), parts (the number of parts it examined), wall_time
+            and cpu_time in seconds
+    """
+    if results is None:
+        results = CheckResults()
+    wall_start = time.perf_counter()
+    cpu_start = cpu_time()
+    passed = check()
+    wall_time = time.perf_counter() - wall_start
+    cpu_used = cpu_time() - cpu_start
+
+    return passed, {
+        "name": name,
+        "status": "passed" if passed else "failed",
+        "errors": [] if passed else list(results.errors),
+        "parts": len(results.parts),
+        "wall_time": round(wall_time, 6),
+        "cpu_time": round(cpu_used, 6),
+    }
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
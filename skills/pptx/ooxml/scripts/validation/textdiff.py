@@ -0,0 +1,276 @@
+"""
+In-process paragraph and character diff used to report redlining failures.
+"""
+
+# Character diffs costing more edits than this are shown as a single replacement
+MAX_CHAR_EDITS = 2000
+
+# Paragraph diffs costing more edits than this compare the differing paragraphs
+# in order instead of searching for the shortest alignment
+MAX_PARAGRAPH_EDITS = 1000
+
+
+def myers_opcodes(a, b, max_cost=None):
+    """Compute a shortest edit script between two sequences (Myers' algorithm).
+
+    Common leading and trailing elements are trimmed before the search, so the
+    cost is proportional to the size of the differing region.
+
+    Args:
+        a: Original sequence
+        b: Modified sequence
+        max_cost: Give up and report the differing region as one replacement if
+            more than this many insertions and deletions are needed
+
+    Returns:
+        list: (tag, i1, i2, j1, j2) tuples in the style of
+            difflib.SequenceMatcher.get_opcodes, where tag is "equal", "replace",
+            "delete" or "insert"
+    """
+    n, m = len(a), len(b)
+    prefix = 0
+    while prefix < n and prefix < m and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < n - prefix
+        and suffix < m - prefix
+        and a[n - 1 - suffix] == b[m - 1 - suffix]
+    ):
+        suffix += 1
+
+    # Per-element moves of the differing region, offset to full indices
+    moves = _myers_moves(a[prefix : n - suffix], b[prefix : m - suffix], max_cost)
+    if moves is None:
+        moves = [("delete", i, None) for i in range(n - prefix - suffix)] + [
+            ("insert", None, j) for j in range(m - prefix - suffix)
+        ]
+
+    opcodes = []
+    if prefix:
+        opcodes.append(("equal", 0, prefix, 0, prefix))
+
+    i, j = prefix, prefix
+    pending = None  # [i1, i2, j1, j2] of the current run of edits
+    for move, _, _ in moves:
+        if move == "equal":
+            if pending:
+                opcodes.append(_edit_opcode(*pending))
+                pending = None
+            if opcodes and opcodes[-1][0] == "equal":
+                tag, i1, _, j1, _ = opcodes.pop()
+                opcodes.append((tag, i1, i + 1, j1, j + 1))
+            else:
+                opcodes.append(("equal", i, i + 1, j, j + 1))
+            i += 1
+            j += 1
+        else:
+            if pending is None:
+                pending = [i, i, j, j]
+            if move == "delete":
+                i += 1
+                pending[1] = i
+            else:
+                j += 1
+                pending[3] = j
+    if pending:
+        opcodes.append(_edit_opcode(*pending))
+
+    if suffix:
+        opcodes.append(("equal", n - suffix, n, m - suffix, m))
+    return opcodes
+
+
+def _edit_opcode(i1, i2, j1, j2):
+    """Return the opcode for a run of insertions and deletions."""
+    if i1 == i2:
+        return ("insert", i1, i2, j1, j2)
+    if j1 == j2:
+        return ("delete", i1, i2, j1, j2)
+    return ("replace", i1, i2, j1, j2)
+
+
+def _myers_moves(a, b, max_cost):
+    """Return the moves of a shortest edit script, or None if max_cost is exceeded.
+
+    Uses the linear-space variant of Myers' algorithm: each region is split at
+    a point on a shortest path found by searching from both ends (the middle
+    snake) and the halves are solved in turn, so memory stays proportional to
+    the length of the sequences.
+
+    Returns:
+        list: ("equal" | "delete" | "insert", i, j) moves in order
+    """
+    moves = []
+    if not _append_moves(a, b, 0, 0, moves, max_cost):
+        return None
+    return moves
+
+
+def _append_moves(a, b, i, j, moves, max_cost=None):
+    """Append the moves from a to b, at offsets i and j, to moves.
+
+    Returns:
+        bool: False if more than max_cost edits are needed (nothing is appended)
+    """
+    n, m = len(a), len(b)
+    prefix = 0
+    while prefix < n and prefix < m and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < n - prefix
+        and suffix < m - prefix
+        and a[n - 1 - suffix] == b[m - 1 - suffix]
+    ):
+        suffix += 1
+    a_middle = a[prefix : n - suffix]
+    b_middle = b[prefix : m - suffix]
+
+    split = None
+    if a_middle and b_middle:
+        split = _middle_split(a_middle, b_middle, max_cost)
+        if split is None and max_cost is not None:
+            return False
+
+    moves.extend(("equal", i + k, j + k) for k in range(prefix))
+    i += prefix
+    j += prefix
+    if split is None:
+        moves.extend(("delete", i + k, None) for k in range(len(a_middle)))
+        moves.extend(("insert", None, j + k) for k in range(len(b_middle)))
+    else:
+        x, y = split
+        _append_moves(a_middle[:x], b_middle[:y], i, j, moves)
+        _append_moves(a_middle[x:], b_middle[y:], i + x, j + y, moves)
+    i += len(a_middle)
+    j += len(b_middle)
+    moves.extend(("equal", i + k, j + k) for k in range(suffix))
+    return True
+
+
+def _middle_split(a, b, max_cost=None):
+    """Find a point (x, y) on a shortest edit path from a to b.
+
+    Searches forwards from the start and backwards from the end until the two
+    searches overlap. a and b must be non-empty and differ in their first and
+    last elements.
+
+    Returns:
+        tuple: (x, y) splitting a and b, or None if more than max_cost edits
+            are needed
+    """
+    n, m = len(a), len(b)
+    max_d = (n + m + 1) // 2
+    offset = max_d
+    forward = [-1] * (2 * max_d + 2)
+    forward[offset + 1] = 0
+    backward = forward[:]
+    delta = n - m
+    # With an odd delta the searches overlap on a forward step, else on a backward one
+    odd = delta % 2 != 0
+    # Diagonals that have run off the grid on either side
+    forward_start = forward_end = backward_start = backward_end = 0
+
+    for d in range(max_d + 1):
+        # Neither search has overlapped, so at least 2d - 1 edits are needed
+        if max_cost is not None and 2 * d - 1 > max_cost:
+            return None
+
+        for k in range(-d + forward_start, d + 1 - forward_end, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            forward[offset + k] = x
+            if x > n:
+                forward_end += 2
+            elif y > m:
+                forward_start += 2
+            elif odd:
+                reverse_x = backward[offset + delta - k] if abs(delta - k) <= max_d else -1
+                if reverse_x != -1 and x >= n - reverse_x:
+                    return x, y
+
+        for k in range(-d + backward_start, d + 1 - backward_end, 2):
+            if k == -d or (k != d and backward[offset + k - 1] < backward[offset + k + 1]):
+                x = backward[offset + k + 1]
+            else:
+                x = backward[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[n - 1 - x] == b[m - 1 - y]:
+                x += 1
+                y += 1
+            backward[offset + k] = x
+            if x > n:
+                backward_end += 2
+            elif y > m:
+                backward_start += 2
+            elif not odd:
+                forward_x = forward[offset + delta - k] if abs(delta - k) <= max_d else -1
+                if forward_x != -1 and forward_x >= n - x:
+                    return forward_x, forward_x - (delta - k)
+    return None
+
+
+def _paragraph_diff(old, new):
+    """Return a paragraph with its changes marked, in word_diff's format."""
+    parts = []
+    for tag, i1, i2, j1, j2 in myers_opcodes(old, new, MAX_CHAR_EDITS):
+        if tag == "equal":
+            parts.append(new[j1:j2])
+            continue
+        if tag in ("delete", "replace"):
+            parts.append(f"[-{old[i1:i2]}-]")
+        if tag in ("insert", "replace"):
+            parts.append(f"{{+{new[j1:j2]}+}}")
+    return "".join(parts)
+
+
+def word_diff(original_text, modified_text):
+    """Show the differences between two texts in git's plain word-diff format.
+
+    Texts are compared paragraph by paragraph (one paragraph per line). Identical
+    paragraphs are matched by value and skipped; the paragraphs of each run that
+    differs are paired in order and compared character by character, and any
+    left over were deleted or inserted whole. Deleted text is shown as
+    [-text-] and inserted text as {+text+}, and only changed paragraphs are
+    printed, like `git diff --word-diff=plain --word-diff-regex=. -U0`.
+
+    Args:
+        original_text: Original text, one paragraph per line
+        modified_text: Modified text, one paragraph per line
+
+    Returns:
+        str: The changed paragraphs with inline markers ("" if none differ)
+    """
+    original_paragraphs = original_text.split("\n")
+    modified_paragraphs = modified_text.split("\n")
+
+    # Compare paragraphs by interned ID so each one is hashed only once
+    ids = {}
+    original_ids = [ids.setdefault(p, len(ids)) for p in original_paragraphs]
+    modified_ids = [ids.setdefault(p, len(ids)) for p in modified_paragraphs]
+
+    lines = []
+    for tag, i1, i2, j1, j2 in myers_opcodes(
+        original_ids, modified_ids, MAX_PARAGRAPH_EDITS
+    ):
+        if tag == "equal":
+            continue
+        for k in range(max(i2 - i1, j2 - j1)):
+            old = original_paragraphs[i1 + k] if i1 + k < i2 else ""
+            new = modified_paragraphs[j1 + k] if j1 + k < j2 else ""
+            line = _paragraph_diff(old, new)
+            if line.strip():
+                lines.append(line)
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -50,9 +50,17 @@ from inventory import extract_text_inventory
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
 
+# The soffice worker pool ships with the OOXML scripts of this skill
+sys.path.append(str(Path(__file__).resolve().parent.parent / "ooxml" / "scripts"))
+try:
+    import soffice_pool
+except ImportError:
+    soffice_pool = None
+
 # Constants
 THUMBNAIL_WIDTH = 300  # Fixed thumbnail width in pixels
 CONVERSION_DPI = 100  # DPI for PDF to image conversion
+PDF_TIMEOUT = 300  # Seconds allowed for the PDF conversion
 MAX_COLS = 6  # Maximum number of columns
 DEFAULT_COLS = 5  # Default number of columns
 JPEG_QUALITY = 95  # JPEG compression quality
@@ -86,6 +94,11 @@ def main():
         action="store_true",
         help="Outline text placeholders with a colored border",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render with LibreOffice even if the same deck was rendered before",
+    )
 
     args = parser.parse_args()
 
@@ -119,7 +132,9 @@ def main():
                     print(f"Found placeholders on {len(placeholder_regions)} slides")
 
             # Convert slides to images
-            slide_images = convert_to_images(input_path, Path(temp_dir), CONVERSION_DPI)
+            slide_images = convert_to_images(
+                input_path, Path(temp_dir), CONVERSION_DPI, not args.no_cache
+            )
             if not slide_images:
                 print("Error: No slides found")
                 sys.exit(1)
@@ -194,7 +209,39 @@ def get_placeholder_regions(pptx_path):
     return placeholder_regions, (slide_width_inches, slide_height_inches)
 
 
-def convert_to_images(pptx_path, temp_dir, dpi):
+def convert_to_pdf(pptx_path, temp_dir, use_cache=True):
+    """Convert the presentation to PDF in temp_dir.
+
+    Uses the soffice worker pool when it is available and reuses the PDF of an
+    identical deck from the conversion cache unless use_cache is False.
+    """
+    if soffice_pool is not None:
+        try:
+            soffice_pool.convert(
+                pptx_path, temp_dir, "pdf", PDF_TIMEOUT, use_cache=use_cache
+            )
+            return
+        except (soffice_pool.ConversionError, TimeoutError) as e:
+            raise RuntimeError(f"PDF conversion failed: {e}") from e
+
+    result = subprocess.run(
+        [
+            "soffice",
+            "--headless",
+            "--convert-to",
+            "pdf",
+            "--outdir",
+            str(temp_dir),
+            str(pptx_path),
+        ],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError("PDF conversion failed")
+
+
+def convert_to_images(pptx_path, temp_dir, dpi, use_cache=True):
     """Convert PowerPoint to images via PDF, handling hidden slides."""
     # Detect hidden slides
     print("Analyzing presentation...")
@@ -216,20 +263,8 @@ def convert_to_images(pptx_path, temp_dir, dpi):
 
     # Convert to PDF
     print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
+    convert_to_pdf(pptx_path, temp_dir, use_cache)
+    if not pdf_path.exists():
         raise RuntimeError("PDF conversion failed")
 
     # Convert PDF to images
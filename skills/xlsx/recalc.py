@@ -12,6 +12,11 @@ import platform
 from pathlib import Path
 from openpyxl import load_workbook
 
+try:
+    import soffice_pool
+except ImportError:
+    soffice_pool = None
+
 
 def setup_libreoffice_macro():
     """Setup LibreOffice macro for recalculation if not already configured"""
@@ -50,13 +55,14 @@ def setup_libreoffice_macro():
         return False
 
 
-def recalc(filename, timeout=30):
+def recalc(filename, timeout=30, use_cache=True):
     """
     Recalculate formulas in Excel file and report any errors
     
     Args:
         filename: Path to Excel file
         timeout: Maximum time to wait for recalculation (seconds)
+        use_cache: Reuse the result of recalculating an identical file before
     
     Returns:
         dict with error locations and counts
@@ -66,8 +72,43 @@ def recalc(filename, timeout=30):
     
     abs_path = str(Path(filename).absolute())
     
+    # Identical workbooks recalculate to identical files
+    cache = soffice_pool.ConversionCache() if soffice_pool is not None and use_cache else None
+    key = cache.key(abs_path, 'recalc') if cache else None
+    if cache and cache.fetch(key, abs_path):
+        return check_errors(filename)
+    
+    completed, error = run_libreoffice(abs_path, timeout)
+    if error:
+        return error
+    if cache and completed:
+        cache.store(key, abs_path)
+    
+    return check_errors(filename)
+
+
+def run_libreoffice(abs_path, timeout):
+    """
+    Recalculate and save the file with LibreOffice
+    
+    Returns:
+        (completed, error): completed is False if LibreOffice timed out,
+        error is an error dict or None
+    """
+    # Recalculate on a persistent soffice worker when the pool is available
+    if soffice_pool is not None and soffice_pool.available():
+        try:
+            soffice_pool.recalculate(abs_path, timeout)
+            return True, None
+        except soffice_pool.PoolUnavailable:
+            pass
+        except TimeoutError:
+            return False, None
+        except soffice_pool.ConversionError as e:
+            return False, {'error': str(e)}
+    
     if not setup_libreoffice_macro():
-        return {'error': 'Failed to setup LibreOffice macro'}
+        return False, {'error': 'Failed to setup LibreOffice macro'}
     
     cmd = [
         'soffice', '--headless', '--norestore',
@@ -94,10 +135,15 @@ def recalc(filename, timeout=30):
     if result.returncode != 0 and result.returncode != 124:  # 124 is timeout exit code
         error_msg = result.stderr or 'Unknown error during recalculation'
         if 'Module1' in error_msg or 'RecalculateAndSave' not in error_msg:
-            return {'error': 'LibreOffice macro not configured properly'}
+            return False, {'error': 'LibreOffice macro not configured properly'}
         else:
-            return {'error': error_msg}
+            return False, {'error': error_msg}
     
+    return result.returncode == 0, None
+
+
+def check_errors(filename):
+    """Scan a recalculated Excel file for formula errors and count its formulas"""
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
         wb = load_workbook(filename, data_only=True)
@@ -156,8 +202,11 @@ def recalc(filename, timeout=30):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python recalc.py <excel_file> [timeout_seconds]")
+    args = [arg for arg in sys.argv[1:] if arg != '--no-cache']
+    use_cache = len(args) == len(sys.argv) - 1
+    
+    if len(args) < 1:
+        print("Usage: python recalc.py <excel_file> [timeout_seconds] [--no-cache]")
         print("\nRecalculates all formulas in an Excel file using LibreOffice")
         print("\nReturns JSON with error details:")
         print("  - status: 'success' or 'errors_found'")
@@ -165,12 +214,13 @@ def main():
         print("  - total_formulas: Number of formulas in the file")
         print("  - error_summary: Breakdown by error type with locations")
         print("    - #VALUE!, #DIV/0!, #REF!, #NAME?, #NULL!, #NUM!, #N/A")
+        print("\n--no-cache recalculates even if an identical file was recalculated before")
         sys.exit(1)
     
-    filename = sys.argv[1]
-    timeout = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    filename = args[0]
+    timeout = int(args[1]) if len(args) > 1 else 30
     
-    result = recalc(filename, timeout)
+    result = recalc(filename, timeout, use_cache)
     print(json.dumps(result, indent=2))
 
 